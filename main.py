@@ -7,7 +7,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.db.qdrant_client import ensure_collection
-from src.routes import chat, health, ingest_route
+from src.routes import chat, health, ingest_route, search
 
 logging.basicConfig(
     level=logging.INFO,
@@ -47,6 +47,7 @@ app.add_middleware(
 )
 
 app.include_router(chat.router, tags=["Chat"])
+app.include_router(search.router, tags=["Search"])
 app.include_router(ingest_route.router, tags=["Ingestion"])
 app.include_router(health.router, tags=["Health"])
 
@@ -0,0 +1,183 @@
+"""
+Compressed on-disk store of raw crawled pages.
+Appending each fetched response (URL, headers, fetch time, HTML or
+extracted PDF text) to zlib-compressed segment files with a JSON-lines
+index, so pages can be re-cleaned and re-chunked later without crawling
+osha.gov again.
+"""
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from typing import Iterator
+
+from src.config import PAGE_STORE_DIR, PAGE_STORE_SEGMENT_BYTES
+
+logger = logging.getLogger(__name__)
+
+_LENGTH = struct.Struct(">I")  # Big-endian uint32 record length prefix
+
+
+class PageStore:
+    """
+    Append-only segment store. Each record is a length-prefixed, independently
+    compressed JSON blob, so any page can be read back with one seek. The index
+    maps URLs to (segment, offset, length); the latest record for a URL wins.
+    """
+
+    def __init__(self, directory: str = PAGE_STORE_DIR, segment_bytes: int = PAGE_STORE_SEGMENT_BYTES):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.index_path = os.path.join(directory, "index.jsonl")
+        os.makedirs(directory, exist_ok=True)
+
+        self._index: dict[str, dict] = {}
+        self._load_index()
+        self._segment = self._latest_segment()
+        self._segment_file = None
+        self._index_file = None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._index
+
+    def urls(self) -> list[str]:
+        """Listing every stored URL."""
+        return list(self._index)
+
+    def append(
+        self,
+        url: str,
+        html: str,
+        headers: dict | None = None,
+        status: int = 200,
+        pdf_pages: list[list] | None = None,
+        pdf_title: str = "",
+    ) -> None:
+        """
+        Appending one fetched response. Flushing the record before its index entry.
+        PDFs are stored as their extracted [page_number, text] pairs, not raw bytes.
+        """
+        record = {
+            "url": url,
+            "status": status,
+            "headers": dict(headers or {}),
+            "fetched_at": time.time(),
+            "html": html,
+        }
+        if pdf_pages is not None:
+            record["pdf_pages"] = pdf_pages
+            record["pdf_title"] = pdf_title
+        blob = zlib.compress(json.dumps(record).encode(), 6)
+
+        segment_path = self._segment_path(self._segment)
+        if os.path.exists(segment_path) and os.path.getsize(segment_path) + len(blob) > self.segment_bytes:
+            self._roll_segment()
+
+        f = self._open_segment()
+        offset = f.tell()
+        f.write(_LENGTH.pack(len(blob)))
+        f.write(blob)
+        f.flush()
+
+        entry = {
+            "url": url,
+            "segment": self._segment,
+            "offset": offset,
+            "length": len(blob),
+            "fetched_at": record["fetched_at"],
+        }
+        if self._index_file is None:
+            self._index_file = open(self.index_path, "a")
+        self._index_file.write(json.dumps(entry) + "\n")
+        self._index_file.flush()
+        self._index[url] = entry
+
+    def get(self, url: str) -> dict | None:
+        """Reading the latest stored response for a URL."""
+        entry = self._index.get(url)
+        if entry is None:
+            return None
+        with open(self._segment_path(entry["segment"]), "rb") as f:
+            return self._read_record(f, entry)
+
+    def iter_pages(self) -> Iterator[dict]:
+        """Streaming the latest response for every stored URL in segment order."""
+        entries = sorted(self._index.values(), key=lambda e: (e["segment"], e["offset"]))
+        current_segment = None
+        f = None
+        try:
+            for entry in entries:
+                if entry["segment"] != current_segment:
+                    if f is not None:
+                        f.close()
+                    current_segment = entry["segment"]
+                    f = open(self._segment_path(current_segment), "rb")
+                record = self._read_record(f, entry)
+                if record is not None:
+                    yield record
+        finally:
+            if f is not None:
+                f.close()
+
+    def close(self) -> None:
+        for f in (self._segment_file, self._index_file):
+            if f is not None:
+                f.close()
+        self._segment_file = None
+        self._index_file = None
+
+    def _read_record(self, f, entry: dict) -> dict | None:
+        try:
+            f.seek(entry["offset"])
+            (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+            return json.loads(zlib.decompress(f.read(length)))
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            logger.warning(f"Skipping unreadable stored page {entry['url']}: {e}")
+            return None
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, "rb") as f:
+            data = f.read()
+
+        # Truncating a torn last line from a crash, so the next append starts on a fresh
+        # line instead of being glued to it; the torn record itself is simply unindexed
+        complete = data.rfind(b"\n") + 1
+        if complete != len(data):
+            with open(self.index_path, "r+b") as f:
+                f.truncate(complete)
+
+        for line in data[:complete].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self._index[entry["url"]] = entry
+
+    def _latest_segment(self) -> int:
+        segments = [
+            int(name[len("segment-"):-len(".seg")])
+            for name in os.listdir(self.directory)
+            if name.startswith("segment-") and name.endswith(".seg")
+        ]
+        return max(segments, default=1)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment:05d}.seg")
+
+    def _open_segment(self):
+        if self._segment_file is None:
+            self._segment_file = open(self._segment_path(self._segment), "ab")
+        return self._segment_file
+
+    def _roll_segment(self) -> None:
+        if self._segment_file is not None:
+            self._segment_file.close()
+            self._segment_file = None
+        self._segment += 1
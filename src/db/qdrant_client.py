@@ -1,8 +1,31 @@
+import time
+import uuid
+
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import Distance, VectorParams
+from qdrant_client.http.models import (
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    Distance,
+    PayloadSchemaType,
+    VectorParams,
+)
 
 from src.config import COLLECTION_NAME, EMBEDDING_DIM, QDRANT_URL
 
+# Payload fields indexed after bulk loads (LangChain nests chunk fields under "metadata")
+PAYLOAD_INDEXES = {
+    "metadata.chunk_hash": PayloadSchemaType.KEYWORD,
+    "metadata.source_url": PayloadSchemaType.KEYWORD,
+    "metadata.content_type": PayloadSchemaType.KEYWORD,
+    "metadata.cfr_part": PayloadSchemaType.KEYWORD,
+}
+
+class AliasSwapError(Exception):
+    """Raised when the alias update fails after the legacy live collection was already deleted."""
+
+
 # Singleton client instance
 _client = None
 
@@ -15,18 +38,102 @@ def get_qdrant_client():
     return _client
 
 
+def resolve_alias(alias_name: str = COLLECTION_NAME) -> str | None:
+    """Returning the collection an alias points to, or None if it is not an alias."""
+    client = get_qdrant_client()
+    for alias in client.get_aliases().aliases:
+        if alias.alias_name == alias_name:
+            return alias.collection_name
+    return None
+
+
+def create_versioned_collection(base_name: str = COLLECTION_NAME) -> str:
+    """Creating a new timestamped collection, e.g. osha_laws_regs_v1735689600123_3f9a1c."""
+    client = get_qdrant_client()
+    # Milliseconds plus a random suffix, so back-to-back creations (startup, then a rebuild) never collide
+    name = f"{base_name}_v{int(time.time() * 1000)}_{uuid.uuid4().hex[:6]}"
+    client.create_collection(
+        collection_name=name,
+        vectors_config=VectorParams(
+            size=EMBEDDING_DIM,
+            distance=Distance.COSINE,
+        ),
+    )
+    print(f"Created Qdrant collection: {name}")
+    return name
+
+
+def swap_alias(collection_name: str, alias_name: str = COLLECTION_NAME) -> str | None:
+    """
+    Pointing the alias at a collection in one atomic alias update.
+    Returning the collection the alias previously pointed to, if any.
+    """
+    client = get_qdrant_client()
+    previous = resolve_alias(alias_name)
+    existing = [c.name for c in client.get_collections().collections]
+
+    operations = []
+    legacy_deleted = False
+    if previous is not None:
+        operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=alias_name)))
+    elif alias_name in existing:
+        # Migrating a pre-alias deployment: the name is taken by a real collection,
+        # which has to go before the alias can exist (brief gap, first rebuild only)
+        client.delete_collection(alias_name)
+        legacy_deleted = True
+        print(f"Deleted legacy Qdrant collection: {alias_name}")
+    operations.append(
+        CreateAliasOperation(create_alias=CreateAlias(collection_name=collection_name, alias_name=alias_name))
+    )
+
+    # Once the legacy collection is gone the new one is the only copy, so try harder before giving up
+    attempts = 3 if legacy_deleted else 1
+    for attempt in range(attempts):
+        try:
+            client.update_collection_aliases(change_aliases_operations=operations)
+            break
+        except Exception as e:
+            if attempt < attempts - 1:
+                time.sleep(2 ** attempt)
+                continue
+            if legacy_deleted:
+                raise AliasSwapError(
+                    f"Deleted legacy collection {alias_name} but could not point the alias at {collection_name}: {e}"
+                ) from e
+            raise
+    print(f"Alias {alias_name} -> {collection_name}")
+    return previous
+
+
 def ensure_collection():
-    """Create the OSHA collection if it does not already exist."""
+    """
+    Create the OSHA collection if it does not already exist.
+    New deployments get a versioned collection behind the COLLECTION_NAME alias,
+    so later rebuilds can swap collections without downtime.
+    """
     client = get_qdrant_client()
     existing = [c.name for c in client.get_collections().collections]
-    if COLLECTION_NAME not in existing:
-        client.create_collection(
-            collection_name=COLLECTION_NAME,
-            vectors_config=VectorParams(
-                size=EMBEDDING_DIM,
-                distance=Distance.COSINE,
-            ),
-        )
-        print(f"Created Qdrant collection: {COLLECTION_NAME}")
-    else:
+    live = resolve_alias(COLLECTION_NAME)
+    if live is not None:
+        print(f"Qdrant alias {COLLECTION_NAME} -> {live}")
+    elif COLLECTION_NAME in existing:
         print(f"Qdrant collection already exists: {COLLECTION_NAME}")
+    else:
+        live = create_versioned_collection()
+        swap_alias(live)
+    ensure_payload_indexes(live or COLLECTION_NAME)
+
+
+def ensure_payload_indexes(collection_name: str = COLLECTION_NAME):
+    """Creating the payload indexes used for dedup and filtering. Safe to call repeatedly."""
+    client = get_qdrant_client()
+    existing = client.get_collection(collection_name).payload_schema or {}
+    for field_name, schema in PAYLOAD_INDEXES.items():
+        if field_name not in existing:
+            client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=schema,
+                wait=True,
+            )
+            print(f"Created payload index {field_name} on {collection_name}")
@@ -0,0 +1,121 @@
+"""
+Bulk upsert writer for Qdrant.
+Sending fixed-size point batches from a small thread pool with wait=False,
+retrying failed batches, and finishing with a single consistency barrier
+so bulk loads are bound by embedding speed rather than upload round trips.
+"""
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+import numpy as np
+from qdrant_client.http.models import Batch
+
+from src.config import UPSERT_BATCH_SIZE, UPSERT_MAX_RETRIES, UPSERT_PARALLEL
+from src.db.qdrant_client import ensure_payload_indexes, get_qdrant_client
+
+logger = logging.getLogger(__name__)
+
+
+class QdrantUpsertWriter:
+    """Buffering points and writing them to a collection in parallel batches."""
+
+    def __init__(
+        self,
+        collection_name: str,
+        batch_size: int = UPSERT_BATCH_SIZE,
+        parallel: int = UPSERT_PARALLEL,
+        max_retries: int = UPSERT_MAX_RETRIES,
+        on_batch_written: Callable[[int], None] | None = None,
+    ):
+        self.collection_name = collection_name
+        self.batch_size = batch_size
+        self.parallel = max(parallel, 1)
+        self.max_retries = max_retries
+        self.on_batch_written = on_batch_written
+        self.points_written = 0
+
+        self._client = get_qdrant_client()
+        self._executor = ThreadPoolExecutor(max_workers=self.parallel, thread_name_prefix="qdrant-upsert")
+        self._in_flight: deque[tuple[Future, int]] = deque()
+        self._ids: list[str] = []
+        self._vectors: list[np.ndarray] = []
+        self._payloads: list[dict] = []
+        self._last_batch: tuple[list, list, list] | None = None
+
+    def add(self, ids: list[str], vectors: np.ndarray, payloads: list[dict]) -> None:
+        """Queueing points, sending a batch every time batch_size points are buffered."""
+        self._ids.extend(ids)
+        self._vectors.extend(vectors)
+        self._payloads.extend(payloads)
+        while len(self._ids) >= self.batch_size:
+            self._submit(self.batch_size)
+
+    def drain(self) -> None:
+        """Sending any buffered points and waiting until every batch is acknowledged."""
+        if self._ids:
+            self._submit(len(self._ids))
+        while self._in_flight:
+            self._reap_oldest()
+
+    def close(self) -> None:
+        """
+        Draining, then re-sending the final batch with wait=True as a consistency
+        barrier: Qdrant applies updates in order, so once it returns every earlier
+        batch is applied and searchable. Building payload indexes afterwards.
+        """
+        try:
+            self.drain()
+            if self._last_batch is not None:
+                self._send(*self._last_batch, wait=True)
+                ensure_payload_indexes(self.collection_name)
+            logger.info(f"Upsert writer finished: {self.points_written} points written to {self.collection_name}")
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stopping the worker threads without a barrier, e.g. after a failed run."""
+        self._executor.shutdown(wait=True)
+
+    def _submit(self, count: int) -> None:
+        ids, self._ids = self._ids[:count], self._ids[count:]
+        vectors, self._vectors = self._vectors[:count], self._vectors[count:]
+        payloads, self._payloads = self._payloads[:count], self._payloads[count:]
+        self._last_batch = (ids, vectors, payloads)
+
+        # Bounding in-flight batches so a fast embedder cannot queue unbounded memory
+        while len(self._in_flight) >= self.parallel * 2:
+            self._reap_oldest()
+
+        future = self._executor.submit(self._send, ids, vectors, payloads, False)
+        self._in_flight.append((future, len(ids)))
+
+    def _reap_oldest(self) -> None:
+        future, count = self._in_flight.popleft()
+        future.result()
+        self.points_written += count
+        if self.on_batch_written is not None:
+            self.on_batch_written(count)
+
+    def _send(self, ids: list[str], vectors: list[np.ndarray], payloads: list[dict], wait: bool) -> None:
+        """Upserting one batch, retrying with exponential backoff."""
+        # Vectors stay float32 numpy rows up to here; the REST API takes JSON, so this
+        # per-batch conversion is the wire boundary (qdrant-client's own uploaders do the same)
+        batch = Batch(
+            ids=ids,
+            vectors=np.stack(vectors).astype(np.float32, copy=False).tolist(),
+            payloads=payloads,
+        )
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._client.upsert(collection_name=self.collection_name, points=batch, wait=wait)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(f"Upsert batch of {len(ids)} points failed after {attempt + 1} attempts: {e}")
+                    raise
+                delay = 2 ** attempt
+                logger.warning(f"Upsert batch failed ({e}), retrying in {delay}s...")
+                time.sleep(delay)
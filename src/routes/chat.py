@@ -2,12 +2,14 @@
 Chat endpoint for OSHA RAG queries with conversation history.
 """
 import hashlib
+import json
 import logging
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
 
 from src.services.rag_chain import query_rag_chain
+from src.utils.admission import AdmissionRejected, chat_admission
 from src.utils.cache import retrieval_cache
 
 router = APIRouter()
@@ -19,9 +21,15 @@ class ChatMessage(BaseModel):
     content: str
 
 
+class ChatFilters(BaseModel):
+    cfr_part: Optional[list[str]] = None  # e.g. ["1926"] for construction
+    content_type: Optional[list[str]] = None  # regulation, interpretation, federal-register, publication, laws-regs
+
+
 class ChatRequest(BaseModel):
     message: str
     history: Optional[list[ChatMessage]] = []
+    filters: Optional[ChatFilters] = None
 
 
 class CitationResponse(BaseModel):
@@ -41,8 +49,15 @@ async def chat(request: ChatRequest):
     Main chat endpoint using Groq Llama 3.3 70B.
     Retrieves OSHA context and generates answers with citations.
     Supports conversation history for contextual responses.
+    Optional filters scope retrieval to a CFR part or content type.
+    Cache hits are served immediately; generations go through admission
+    control and get a 429 with Retry-After when the server is saturated.
     """
-    cache_key = hashlib.md5(request.message.lower().strip().encode()).hexdigest()
+    filters = request.filters.model_dump(exclude_none=True) if request.filters else None
+    cache_input = request.message.lower().strip()
+    if filters:
+        cache_input += json.dumps(filters, sort_keys=True)
+    cache_key = hashlib.md5(cache_input.encode()).hexdigest()
 
     # Only use cache if no history (first message)
     if not request.history:
@@ -54,7 +69,16 @@ async def chat(request: ChatRequest):
     logger.info(f"Processing question with {len(request.history)} history messages: {request.message[:50]}...")
 
     # Pass history to RAG chain
-    result = await query_rag_chain(request.message, history=request.history)
+    try:
+        async with chat_admission.admit():
+            result = await query_rag_chain(request.message, history=request.history, filters=filters)
+    except AdmissionRejected as e:
+        logger.warning(f"Chat request rejected ({e.reason}), retry after {e.retry_after}s")
+        raise HTTPException(
+            status_code=429,
+            detail="The assistant is busy. Please retry shortly.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
 
     # Only cache if no history
     if not request.history:
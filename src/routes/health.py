@@ -7,7 +7,8 @@ import logging
 from fastapi import APIRouter
 
 from src.config import COLLECTION_NAME
-from src.db.qdrant_client import get_qdrant_client
+from src.db.qdrant_client import get_qdrant_client, resolve_alias
+from src.utils.admission import chat_admission
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -41,14 +42,17 @@ async def metrics():
         info = client.get_collection(COLLECTION_NAME)
         return {
             "collection": COLLECTION_NAME,
+            "live_collection": resolve_alias(COLLECTION_NAME) or COLLECTION_NAME,
             "total_vectors": info.points_count,
             "vectors_count": info.vectors_count,
             "status": info.status.value if info.status else "unknown",
+            "chat_admission": chat_admission.stats(),
         }
     except Exception as e:
         logger.error(f"Metrics fetch failed: {e}")
         return {
             "collection": COLLECTION_NAME,
             "total_vectors": 0,
+            "chat_admission": chat_admission.stats(),
             "error": str(e),
         }
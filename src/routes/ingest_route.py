@@ -1,24 +1,83 @@
 """
-Ingestion route for triggering OSHA content crawling and embedding.
+Ingestion routes for triggering OSHA content crawling and embedding,
+and for tracking or cancelling the resulting ingestion jobs.
 """
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, Depends, Header, HTTPException
 import logging
+import secrets
+from typing import Optional
 
-from src.services.ingest import run_osha_ingestion
+from src.config import INGEST_TOKEN, MAX_INGEST_PAGES
+from src.services.ingest_jobs import IngestJobConflict, job_manager
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER_TOKEN = "change-me-to-a-random-secret"
 
-@router.post("/ingest/osha")
-async def ingest_osha(background_tasks: BackgroundTasks):
-    """Triggering OSHA content ingestion. Running in background to avoid timeout."""
-    logger.info("Starting OSHA ingestion...")
 
-    # Running ingestion in the background
-    background_tasks.add_task(run_osha_ingestion)
+def require_ingest_token(authorization: Optional[str] = Header(None)):
+    """Rejecting requests without "Authorization: Bearer <INGEST_TOKEN>"."""
+    if not INGEST_TOKEN or INGEST_TOKEN == _PLACEHOLDER_TOKEN:
+        # A publicly known default token would be no protection at all
+        raise HTTPException(status_code=503, detail="Ingestion is disabled until INGEST_TOKEN is configured")
 
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token.strip(), INGEST_TOKEN):
+        logger.warning("Rejected ingestion request with a missing or invalid token")
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or missing ingest token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.post("/ingest/osha", status_code=202, dependencies=[Depends(require_ingest_token)])
+async def ingest_osha(max_pages: int = MAX_INGEST_PAGES, resume: bool = True, mode: str = "crawl"):
+    """
+    Triggering OSHA content ingestion as a tracked background job.
+    Only one job may be active at a time; an interrupted job is resumed
+    from its checkpoint unless resume=false. mode=reprocess rebuilds chunks
+    from the raw page store without crawling osha.gov; mode=rebuild does the
+    same into a new collection and swaps it live once validated.
+    """
+    try:
+        job = job_manager.start(max_pages=max_pages, resume=resume, mode=mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IngestJobConflict as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": str(e), "job_id": e.active_job_id},
+        )
+
+    logger.info(f"Starting OSHA ingestion job {job.id}...")
     return {
         "status": "accepted",
-        "message": "OSHA ingestion started in background. Check logs for progress.",
+        "job_id": job.id,
+        "message": f"OSHA ingestion started. Poll /ingest/jobs/{job.id} for progress.",
     }
+
+
+@router.get("/ingest/jobs")
+async def list_ingest_jobs():
+    """Listing recent ingestion jobs, newest first."""
+    return {"jobs": [job.to_dict() for job in job_manager.list()]}
+
+
+@router.get("/ingest/jobs/{job_id}")
+async def get_ingest_job(job_id: str):
+    """Returning progress, rate, and ETA for an ingestion job."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Ingestion job not found")
+    return job.to_dict()
+
+
+@router.post("/ingest/jobs/{job_id}/cancel", dependencies=[Depends(require_ingest_token)])
+async def cancel_ingest_job(job_id: str):
+    """Cancelling an ingestion job. Progress so far stays checkpointed for resume."""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Ingestion job not found")
+    return job.to_dict()
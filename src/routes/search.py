@@ -0,0 +1,75 @@
+"""
+Retrieval-only search endpoint for OSHA passages.
+Returning ranked chunks without an LLM call, for sidebars and internal tools.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+from typing import Optional
+
+from src.config import SEARCH_MAX_LIMIT, SEARCH_MAX_OFFSET
+from src.routes.chat import ChatFilters, CitationResponse
+from src.services.rag_chain import search_chunks
+from src.utils.cache import search_cache
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+class SearchRequest(BaseModel):
+    query: str = Field(min_length=1, max_length=1000)
+    limit: int = Field(10, ge=1, le=SEARCH_MAX_LIMIT)
+    offset: int = Field(0, ge=0, le=SEARCH_MAX_OFFSET)
+    filters: Optional[ChatFilters] = None
+
+
+class SearchResult(BaseModel):
+    rank: int
+    score: float
+    text: str
+    metadata: dict
+    citation: CitationResponse
+
+
+class SearchResponse(BaseModel):
+    query: str
+    limit: int
+    offset: int
+    has_more: bool
+    results: list[SearchResult]
+
+
+@router.post("/search", response_model=SearchResponse)
+async def search(request: SearchRequest):
+    """
+    Retrieval-only search over the OSHA collection.
+    Embeds the query and returns one page of ranked chunks with scores,
+    metadata and citations. Never calls the LLM, so it skips chat admission.
+    """
+    filters = request.filters.model_dump(exclude_none=True) if request.filters else None
+    query = request.query.strip()
+    cache_input = json.dumps(
+        [query.lower(), filters, request.limit, request.offset],
+        sort_keys=True,
+    )
+    cache_key = hashlib.md5(cache_input.encode()).hexdigest()
+
+    cached = search_cache.get(cache_key)
+    if cached:
+        return cached
+
+    # Embedding is CPU-bound and the Qdrant client is synchronous
+    page = await asyncio.to_thread(search_chunks, query, request.limit, request.offset, filters)
+    logger.info(f"Search returned {len(page['results'])} results for: {query[:50]}...")
+
+    result = {
+        "query": query,
+        "limit": request.limit,
+        "offset": request.offset,
+        **page,
+    }
+    search_cache.set(cache_key, result)
+    return result
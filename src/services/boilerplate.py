@@ -0,0 +1,103 @@
+"""
+Cross-page boilerplate detection.
+Fingerprinting cleaned text lines across the whole crawl and dropping lines
+that appear on many distinct pages (sidebars, breadcrumbs, banners) before
+chunking, so they never turn into thousands of duplicate chunks.
+"""
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+
+from src.config import (
+    BOILERPLATE_MIN_FRACTION,
+    BOILERPLATE_MIN_LINE_CHARS,
+    BOILERPLATE_MIN_PAGES,
+    BOILERPLATE_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+# Lines opening with a CFR reference or paragraph designator are regulation text, even when
+# quoted word for word across many interpretation letters, so they are never dropped
+_PROTECTED = re.compile(r"^((29 cfr )?19\d\d\.\d+|\([a-z0-9]{1,6}\))")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class BoilerplateDetector:
+    """
+    Counting on how many distinct pages each line appears, persisted across
+    runs so rebuilds and later crawls start with the full picture. A line is
+    boilerplate once it appears on min_fraction of all observed pages, and on
+    at least min_pages of them.
+    """
+
+    def __init__(
+        self,
+        path: str = BOILERPLATE_PATH,
+        min_pages: int = BOILERPLATE_MIN_PAGES,
+        min_line_chars: int = BOILERPLATE_MIN_LINE_CHARS,
+        min_fraction: float = BOILERPLATE_MIN_FRACTION,
+    ):
+        self.path = path
+        self.min_pages = min_pages
+        self.min_fraction = min_fraction
+        self.min_line_chars = min_line_chars
+        self._pages: set[str] = set()
+        self._counts: dict[str, int] = {}
+        self._load()
+
+    def _fingerprint(self, line: str) -> str | None:
+        normalized = _WHITESPACE.sub(" ", line).strip().lower()
+        if len(normalized) < self.min_line_chars or _PROTECTED.match(normalized):
+            return None
+        return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+
+    def has_seen(self, url: str) -> bool:
+        return url in self._pages
+
+    def observe(self, url: str, text: str) -> None:
+        """Counting each distinct line of a page once. Pages already seen are ignored."""
+        if url in self._pages:
+            return
+        self._pages.add(url)
+        fingerprints = {fp for fp in map(self._fingerprint, text.split("\n")) if fp is not None}
+        for fp in fingerprints:
+            self._counts[fp] = self._counts.get(fp, 0) + 1
+
+    def threshold(self) -> int:
+        """Number of pages a line must appear on to count as boilerplate."""
+        return max(self.min_pages, math.ceil(self.min_fraction * len(self._pages)))
+
+    def strip(self, text: str) -> tuple[str, int]:
+        """Removing boilerplate lines. Returning the kept text and the number of dropped lines."""
+        threshold = self.threshold()
+        kept, dropped = [], 0
+        for line in text.split("\n"):
+            fp = self._fingerprint(line)
+            if fp is not None and self._counts.get(fp, 0) >= threshold:
+                dropped += 1
+            else:
+                kept.append(line)
+        return "\n".join(kept), dropped
+
+    def save(self) -> None:
+        """Writing the counts atomically next to the other ingestion state."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"pages": sorted(self._pages), "counts": self._counts}, f)
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            self._pages = set(data["pages"])
+            self._counts = data["counts"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable boilerplate counts {self.path}: {e}")
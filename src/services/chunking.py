@@ -0,0 +1,179 @@
+"""
+Structure-aware chunking for OSHA regulation text.
+Splitting CFR standards at paragraph boundaries such as 1910.132(d)(1)
+instead of arbitrary character offsets, and keeping each chunk's section
+path so it can be stored as payload and cited precisely.
+"""
+import re
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from src.config import CHUNK_OVERLAP, CHUNK_SIZE
+
+# -- Text splitter configured once, used for unstructured pages and oversized paragraphs --
+text_splitter = RecursiveCharacterTextSplitter(
+    chunk_size=CHUNK_SIZE,
+    chunk_overlap=CHUNK_OVERLAP,
+    separators=["\n\n", "\n", ". ", " ", ""],
+)
+
+# A full paragraph reference at the start of a line, e.g. "1910.132(d)(1)" or "1926.501(b)(13)"
+_FULL_REF = re.compile(r"^(?P<section>19\d\d\.\d+[a-z]?)(?P<path>(?:\([A-Za-z0-9]{1,6}\))*)")
+# A bare paragraph designator at the start of a line, e.g. "(a)", "(12)", "(iv)", "(B)"
+_BARE_REF = re.compile(r"^\((?P<label>[a-z]{1,2}|\d{1,3}|[ivxlc]{1,6}|[A-Z])\)(?=\s|$)")
+_ROMAN = re.compile(r"^[ivxlc]+$")
+
+# CFR paragraph levels: (a) -> (1) -> (i) -> (A)
+_LEVEL_LOWER, _LEVEL_DIGIT, _LEVEL_ROMAN, _LEVEL_UPPER = range(4)
+
+_ROMAN_VALUES = {"i": 1, "v": 5, "x": 10, "l": 50, "c": 100}
+
+
+def _roman_value(label: str) -> int:
+    total = 0
+    for char, next_char in zip(label, label[1:] + " "):
+        value = _ROMAN_VALUES[char]
+        total += -value if value < _ROMAN_VALUES.get(next_char, 0) else value
+    return total
+
+
+def _letter_value(label: str) -> int | None:
+    """Position of a lowercase designator in the sequence a..z, aa..zz; None if malformed."""
+    if len(set(label)) != 1:
+        return None
+    return (len(label) - 1) * 26 + ord(label[0]) - ord("a") + 1
+
+
+def _continues(label: str, level: int, path: list[str]) -> bool:
+    """Whether label is the next designator at level, given the current path."""
+    if level == _LEVEL_ROMAN:
+        if len(path) > _LEVEL_ROMAN and _ROMAN.match(path[_LEVEL_ROMAN]):
+            return _roman_value(label) == _roman_value(path[_LEVEL_ROMAN]) + 1
+        # A roman level only opens with (i), directly under a numbered paragraph
+        return label == "i" and len(path) == _LEVEL_DIGIT + 1
+    if not path:
+        return label == "a"
+    previous = _letter_value(path[_LEVEL_LOWER])
+    return previous is not None and _letter_value(label) == previous + 1
+
+
+def _bare_level(label: str, path: list[str]) -> int:
+    """Working out which CFR level a bare designator belongs to, given the current path."""
+    if label.isdigit():
+        return _LEVEL_DIGIT
+    if label.isupper():
+        return _LEVEL_UPPER
+    if not _ROMAN.match(label) or len(path) <= _LEVEL_DIGIT:
+        return _LEVEL_LOWER
+
+    # "(c)", "(i)", "(v)", "(x)" are ambiguous: whichever level the label continues wins,
+    # so (ii) -> (c) is the next lettered paragraph and (ii) -> (iii) the next roman one
+    as_roman = _continues(label, _LEVEL_ROMAN, path)
+    as_letter = _continues(label, _LEVEL_LOWER, path)
+    if as_roman != as_letter:
+        return _LEVEL_ROMAN if as_roman else _LEVEL_LOWER
+    # Both or neither fit: roman under a numbered paragraph, letters otherwise
+    if label == "i" or len(path) > _LEVEL_ROMAN:
+        return _LEVEL_ROMAN
+    return _LEVEL_LOWER
+
+
+def _split_paragraphs(text: str) -> list[tuple[str, str, str]]:
+    """
+    Splitting text into (cfr_section, section path, paragraph text) segments.
+    A page may hold several sections, so each segment carries its own.
+    Returning [] when the text carries no paragraph structure.
+    """
+    section = None
+    path: list[str] = []
+    segments: list[tuple[str, str, list[str]]] = []
+    preamble: list[str] = []
+    structured = False
+
+    for line in text.split("\n"):
+        stripped = line.strip()
+        full = _FULL_REF.match(stripped)
+        bare = _BARE_REF.match(stripped) if full is None else None
+
+        if full is not None and full.group("path"):
+            section = full.group("section")
+            path = re.findall(r"\(([A-Za-z0-9]+)\)", full.group("path"))
+        elif bare is not None and section is not None:
+            label = bare.group("label")
+            level = _bare_level(label, path)
+            path = path[:level] + [label]
+        elif full is not None and section is not None and full.group("section") != section:
+            # A heading for the next section on the same page, e.g. "1926.95 - Criteria for..."
+            section = full.group("section")
+            path = []
+            segments.append((section, section, [line]))
+            continue
+        else:
+            if full is not None and section is None:
+                # A bare section heading such as "1910.132 - General requirements."
+                section = full.group("section")
+            if segments:
+                segments[-1][2].append(line)
+            else:
+                preamble.append(line)
+            continue
+
+        structured = True
+        ref = section + "".join(f"({p})" for p in path)
+        segments.append((section, ref, [line]))
+
+    if not structured:
+        return []
+
+    result = [(seg_section, ref, "\n".join(lines)) for seg_section, ref, lines in segments]
+    if any(line.strip() for line in preamble):
+        first_section = result[0][0]
+        result.insert(0, (first_section, first_section, "\n".join(preamble)))
+    return result
+
+
+def chunk_page_text(text: str, chunk_size: int = CHUNK_SIZE) -> list[dict]:
+    """
+    Chunking page text, returning dicts with 'text', 'cfr_section' and 'section_path'.
+    Regulation pages are packed paragraph by paragraph up to chunk_size, never
+    cutting inside a paragraph unless it alone exceeds chunk_size. Pages with no
+    CFR structure fall back to the recursive character splitter.
+    """
+    segments = _split_paragraphs(text)
+    if not segments:
+        return [
+            {"text": chunk, "cfr_section": None, "section_path": None}
+            for chunk in text_splitter.split_text(text)
+        ]
+
+    chunks = []
+    current: list[str] = []
+    current_section = None
+    current_path = None
+    current_len = 0
+
+    def emit():
+        if current:
+            chunks.append({"text": "\n".join(current), "cfr_section": current_section, "section_path": current_path})
+
+    for section, ref, body in segments:
+        if len(body) > chunk_size:
+            emit()
+            current, current_path, current_len = [], None, 0
+            for piece in text_splitter.split_text(body):
+                chunks.append({"text": piece, "cfr_section": section, "section_path": ref})
+            continue
+
+        # A chunk never spans two sections, so its cfr_section and cfr_part hold for all of it
+        if current and (current_len + len(body) + 1 > chunk_size or section != current_section):
+            emit()
+            current, current_path, current_len = [], None, 0
+
+        if current_path is None:
+            current_section = section
+            current_path = ref
+        current.append(body)
+        current_len += len(body) + 1
+
+    emit()
+    return chunks
@@ -0,0 +1,104 @@
+"""
+Crawl-time deduplication.
+Canonicalizing URLs so scheme, host, trailing-slash, tracking-parameter and
+print-view variants collapse to one page, and detecting near-duplicate page
+text with 64-bit SimHash fingerprints before anything is chunked or embedded.
+"""
+import hashlib
+import re
+from collections import Counter
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import numpy as np
+
+# Query parameters that never change page content
+_TRACKING_PARAMS = {"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid", "_ga", "_gl", "ref", "source"}
+_PRINT_PARAMS = {"print"}
+_PRINT_VALUES = {("format", "print"), ("view", "print")}
+
+_WORD = re.compile(r"[a-z0-9]+")
+_BANDS = 4  # 64-bit fingerprint split into 4 x 16-bit bands for lookup
+_BAND_BITS = 64 // _BANDS
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalizing an osha.gov URL: https scheme, lowercase www host, no fragment,
+    no trailing slash, no tracking or print-view parameters, sorted query string.
+    """
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    if host == "osha.gov":
+        host = "www.osha.gov"
+
+    path = re.sub(r"/{2,}", "/", parsed.path or "/")
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+        and key.lower() not in _TRACKING_PARAMS
+        and key.lower() not in _PRINT_PARAMS
+        and (key.lower(), value.lower()) not in _PRINT_VALUES
+    ]
+    return urlunparse(("https", host, path, "", urlencode(sorted(query)), ""))
+
+
+def is_pagination_url(url: str) -> bool:
+    """Listing pages beyond the first (?page=N) are crawled for links only, not indexed."""
+    params = dict(parse_qsl(urlparse(url).query))
+    return params.get("page", "0") not in ("", "0")
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """Computing a 64-bit SimHash over word shingles, weighted by shingle frequency."""
+    words = _WORD.findall(text.lower())
+    if len(words) < shingle_size:
+        shingles = Counter([" ".join(words)])
+    else:
+        shingles = Counter(" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1))
+
+    hashes = np.frombuffer(
+        b"".join(hashlib.blake2b(s.encode(), digest_size=8).digest() for s in shingles),
+        dtype=np.uint8,
+    ).reshape(-1, 8)
+    bits = np.unpackbits(hashes, axis=1).astype(np.int64)  # Most significant bit first
+    weights = np.fromiter(shingles.values(), dtype=np.int64, count=len(shingles))
+    scores = ((bits * 2 - 1) * weights[:, None]).sum(axis=0)
+    return int.from_bytes(np.packbits(scores > 0).tobytes(), "big")
+
+
+class NearDuplicateIndex:
+    """
+    Remembering SimHash fingerprints and flagging texts within max_distance bits
+    of one already seen. Fingerprints are banded, so any match within
+    max_distance < _BANDS bits shares at least one exact band.
+    """
+
+    def __init__(self, fingerprints: list[int] | None = None, max_distance: int = 3):
+        self.max_distance = min(max_distance, _BANDS - 1)
+        self.fingerprints: list[int] = []
+        self._bands: dict[tuple[int, int], list[int]] = {}
+        for fingerprint in fingerprints or []:
+            self._add(fingerprint)
+
+    def _band_keys(self, fingerprint: int):
+        mask = (1 << _BAND_BITS) - 1
+        return [(band, (fingerprint >> (band * _BAND_BITS)) & mask) for band in range(_BANDS)]
+
+    def _add(self, fingerprint: int) -> None:
+        self.fingerprints.append(fingerprint)
+        for key in self._band_keys(fingerprint):
+            self._bands.setdefault(key, []).append(fingerprint)
+
+    def check_and_add(self, text: str) -> bool:
+        """Returning True if text is a near-duplicate of a seen page; remembering it otherwise."""
+        fingerprint = simhash(text)
+        for key in self._band_keys(fingerprint):
+            for other in self._bands.get(key, ()):
+                if bin(fingerprint ^ other).count("1") <= self.max_distance:
+                    return True
+        self._add(fingerprint)
+        return False
@@ -2,14 +2,21 @@
 Local embedding service using sentence-transformers.
 Runs MiniLM-L6-v2 directly in the FastAPI container.
 """
+import os
+from typing import Iterator
+
+import numpy as np
 from sentence_transformers import SentenceTransformer
 from langchain_core.embeddings import Embeddings
 
+from src.config import EMBED_BATCH_SIZE, EMBED_PROCESSES
+
 
 class LocalEmbeddings(Embeddings):
     """LangChain-compatible embeddings using local sentence-transformers."""
 
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        self.model_name = model_name
         self.model = SentenceTransformer(model_name)
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
@@ -22,7 +29,65 @@ class LocalEmbeddings(Embeddings):
         embedding = self.model.encode([text], normalize_embeddings=True)
         return embedding[0].tolist()
 
+    def start_pool(self, processes: int = EMBED_PROCESSES):
+        """
+        Starting a multi-process encode pool, or returning None for single-process encoding.
+        processes=0 starts one worker per CPU core.
+        """
+        if processes == 1:
+            return None
+        count = processes or os.cpu_count() or 1
+        return self.model.start_multi_process_pool(target_devices=["cpu"] * count)
+
+    @staticmethod
+    def stop_pool(pool) -> None:
+        """Stopping a pool returned by start_pool."""
+        if pool is not None:
+            SentenceTransformer.stop_multi_process_pool(pool)
+
+    def iter_embedding_batches(
+        self,
+        texts: list[str],
+        batch_size: int = EMBED_BATCH_SIZE,
+        pool=None,
+    ) -> Iterator[tuple[list[int], np.ndarray]]:
+        """
+        Embedding texts for bulk ingestion, yielding (indices, float32 matrix) per bucket.
+
+        Texts are sorted by length and cut into buckets, so each batch holds
+        similarly sized chunks and wastes little compute on padding. Vectors stay
+        float32 numpy arrays end to end instead of being converted to Python lists.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
+        # With a pool, hand each call enough batches to keep every worker busy
+        workers = len(pool["processes"]) if pool is not None else 1
+        bucket_size = batch_size * workers * 4 if pool is not None else batch_size
+
+        for start in range(0, len(order), bucket_size):
+            indices = order[start:start + bucket_size]
+            bucket = [texts[i] for i in indices]
+            if pool is not None:
+                vectors = self.model.encode_multi_process(bucket, pool, batch_size=batch_size)
+                norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+                vectors = vectors / np.maximum(norms, 1e-12)
+            else:
+                vectors = self.model.encode(
+                    bucket,
+                    batch_size=batch_size,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                )
+            yield indices, vectors.astype(np.float32, copy=False)
+
+
+# Singleton embeddings instance, so the model is loaded once per process
+_embeddings = None
+
 
 def get_embeddings() -> LocalEmbeddings:
-    """Return local embeddings instance."""
-    return LocalEmbeddings()
+    """Return a singleton local embeddings instance."""
+    global _embeddings
+    if _embeddings is None:
+        _embeddings = LocalEmbeddings()
+    return _embeddings
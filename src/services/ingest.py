@@ -3,37 +3,57 @@ OSHA web crawler and ingestion pipeline.
 Fetching pages from osha.gov/laws-regs, cleaning HTML, chunking text,
 embedding locally via sentence-transformers, and upserting to Qdrant with rich metadata for citations.
 """
+import asyncio
 import hashlib
+import json
 import logging
+import os
+import re
+import tempfile
+import time
+import uuid
+from collections import deque
+from contextlib import aclosing, suppress
 from urllib.parse import urljoin, urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 from langchain_core.documents import Document
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from qdrant_client.http.models import FieldCondition, Filter, FilterSelector, MatchAny
 
 from src.config import (
-    CHUNK_OVERLAP,
-    CHUNK_SIZE,
     COLLECTION_NAME,
+    EMBED_BATCH_SIZE,
+    EMBED_CACHE_ENABLED,
+    EMBED_PROCESSES,
+    INGEST_BATCH_PAGES,
+    INGEST_CHECKPOINT_PATH,
     MAX_INGEST_PAGES,
     OSHA_BASE_URL,
     OSHA_LAWS_REGS_PATH,
     OSHA_PUBLICATIONS_PATH,
+    PAGE_STORE_ENABLED,
+    PDF_MAX_BYTES,
+    PDF_WORKERS,
     PROXY_ENABLED,
     PROXY_URL,
 )
+from src.db.page_store import PageStore
 from src.db.qdrant_client import get_qdrant_client
-from src.services.embeddings_local import get_embeddings
+from src.db.upsert_writer import QdrantUpsertWriter
+from src.services.boilerplate import BoilerplateDetector
+from src.services.chunking import chunk_page_text
+from src.services.dedup import NearDuplicateIndex, canonicalize_url, is_pagination_url
+from src.services.embeddings_local import LocalEmbeddings, get_embeddings
+from src.services.pdf_extract import PdfExtractionError, extract_pdf_pages
+from src.utils.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
-# -- Text splitter configured once --
-text_splitter = RecursiveCharacterTextSplitter(
-    chunk_size=CHUNK_SIZE,
-    chunk_overlap=CHUNK_OVERLAP,
-    separators=["\n\n", "\n", ". ", " ", ""],
-)
+# "crawl" fetches from osha.gov; "reprocess" replays the raw page store offline
+INGEST_MODES = ("crawl", "reprocess")
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
 
 
 def _compute_chunk_hash(content: str, url: str) -> str:
@@ -98,6 +118,29 @@ def _clean_html(soup: BeautifulSoup) -> str:
     return soup.get_text(separator="\n", strip=True)
 
 
+# URL path prefixes mapped to content types, most specific first
+_CONTENT_TYPES = [
+    ("/laws-regs/regulations/standardnumber", "regulation"),
+    ("/laws-regs/standardinterpretations", "interpretation"),
+    ("/laws-regs/federalregister", "federal-register"),
+    ("/publications", "publication"),
+    ("/sites/default/files/publications", "publication"),
+]
+_CFR_PART = re.compile(r"/standardnumber/(19\d\d)(?:/|$)")
+
+
+def _classify_url(url: str) -> tuple[str, str | None]:
+    """Deriving (content_type, cfr_part) from an osha.gov URL path."""
+    path = urlparse(url).path
+    content_type = "laws-regs"
+    for prefix, name in _CONTENT_TYPES:
+        if path.startswith(prefix):
+            content_type = name
+            break
+    match = _CFR_PART.search(path)
+    return content_type, match.group(1) if match else None
+
+
 def _extract_page_metadata(soup: BeautifulSoup, url: str) -> dict:
     """Extracting metadata from the page for citation support."""
     title = ""
@@ -115,17 +158,50 @@ def _extract_page_metadata(soup: BeautifulSoup, url: str) -> dict:
     if meta_tag:
         meta_desc = meta_tag.get("content", "")
 
-    return {
+    content_type, cfr_part = _classify_url(url)
+
+    metadata = {
         "source_url": url,
         "page_title": title or h1,
         "section_heading": h1,
         "meta_description": meta_desc,
         "domain": "osha.gov",
-        "content_type": "laws-regs",
+        "content_type": content_type,
+    }
+    if cfr_part:
+        metadata["cfr_part"] = cfr_part
+    return metadata
+
+
+def _main_content_text(soup: BeautifulSoup) -> str | None:
+    """Returning the text of the page's main content region, or None if it has none."""
+    main = (
+        soup.find("main")
+        or soup.find(attrs={"role": "main"})
+        or soup.find(id="main-content")
+        or soup.find("article")
+    )
+    return main.get_text(separator="\n", strip=True) if main is not None else None
+
+
+def _build_page(soup: BeautifulSoup, url: str) -> dict | None:
+    """Turning parsed HTML into a page dict, or None if too little text remains."""
+    metadata = _extract_page_metadata(soup, url)
+    clean_text = _clean_html(soup)
+    if len(clean_text.strip()) < 50:
+        return None
+    page = {
+        "url": url,
+        "text": clean_text,
+        "metadata": metadata,
     }
+    main_text = _main_content_text(soup)
+    if main_text:
+        page["main_text"] = main_text
+    return page
 
 
-def _get_existing_hashes() -> set:
+def _get_existing_hashes(collection_name: str = COLLECTION_NAME) -> set:
     """Fetching all existing chunk hashes from Qdrant for deduplication."""
     client = get_qdrant_client()
     existing_hashes = set()
@@ -134,15 +210,16 @@ def _get_existing_hashes() -> set:
         offset = None
         while True:
             result = client.scroll(
-                collection_name=COLLECTION_NAME,
-                limit=100,
+                collection_name=collection_name,
+                limit=1000,
                 offset=offset,
-                with_payload=True,
+                with_payload=["metadata.chunk_hash"],
                 with_vectors=False,
             )
             points, next_offset = result
             for point in points:
-                chunk_hash = point.payload.get("chunk_hash")
+                # LangChain-compatible payloads nest chunk fields under "metadata"
+                chunk_hash = (point.payload.get("metadata") or {}).get("chunk_hash")
                 if chunk_hash:
                     existing_hashes.add(chunk_hash)
             if next_offset is None:
@@ -154,25 +231,195 @@ def _get_existing_hashes() -> set:
     return existing_hashes
 
 
-async def crawl_osha_pages(max_pages: int = MAX_INGEST_PAGES) -> list[dict]:
+def _delete_page_points(urls: list[str], collection_name: str = COLLECTION_NAME) -> None:
+    """Deleting every stored chunk of the given pages, waiting until Qdrant has applied it."""
+    client = get_qdrant_client()
+    client.delete(
+        collection_name=collection_name,
+        points_selector=FilterSelector(
+            filter=Filter(must=[FieldCondition(key="metadata.source_url", match=MatchAny(any=urls))])
+        ),
+        wait=True,
+    )
+
+
+def _build_pdf_page(url: str, pdf_pages: list[list], title: str = "") -> dict | None:
+    """Turning extracted [page_number, text] pairs into a page dict, keeping the per-page text."""
+    text = "\n".join(page_text for _, page_text in pdf_pages)
+    if len(text.strip()) < 50:
+        return None
+
+    content_type, cfr_part = _classify_url(url)
+    metadata = {
+        "source_url": url,
+        "page_title": title or os.path.basename(urlparse(url).path),
+        "section_heading": "",
+        "meta_description": "",
+        "domain": "osha.gov",
+        "content_type": content_type,
+        "source_format": "pdf",
+    }
+    if cfr_part:
+        metadata["cfr_part"] = cfr_part
+    return {
+        "url": url,
+        "text": text,
+        "metadata": metadata,
+        "pdf_pages": pdf_pages,
+    }
+
+
+def _page_from_record(record: dict, url: str) -> dict | None:
+    """Rebuilding a page dict from a raw page store record (blocking)."""
+    if record.get("pdf_pages") is not None:
+        return _build_pdf_page(url, record["pdf_pages"], record.get("pdf_title", ""))
+    return _build_page(BeautifulSoup(record["html"], "html.parser"), url)
+
+
+async def _download_pdf(resp: httpx.Response, url: str) -> str | None:
     """
-    Crawling OSHA laws-regs pages starting from the base path.
-    Returning a list of dicts with 'url', 'html', and 'metadata' keys.
+    Streaming a PDF response to a temporary file under PDF_MAX_BYTES.
+    Returning the file path, or None if the PDF is skipped.
+    """
+    declared = int(resp.headers.get("content-length") or 0)
+    if declared > PDF_MAX_BYTES:
+        logger.warning(f"Skipping {url} (PDF of {declared} bytes exceeds {PDF_MAX_BYTES})")
+        return None
+
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    size = 0
+    with os.fdopen(fd, "wb") as f:
+        async for data in resp.aiter_bytes():
+            size += len(data)
+            if size > PDF_MAX_BYTES:
+                break
+            f.write(data)
+    if size > PDF_MAX_BYTES:
+        logger.warning(f"Skipping {url} (PDF exceeds {PDF_MAX_BYTES} bytes)")
+        os.remove(path)
+        return None
+    return path
+
+
+async def _extract_pdf(path: str, url: str) -> dict | None:
+    """
+    Extracting a downloaded PDF page by page in a sandboxed worker, then removing the file.
+    Returning {"pdf_pages", "pdf_title"} or None if extraction failed.
+    """
+    try:
+        pdf_pages, title = await extract_pdf_pages(path)
+        logger.info(f"Extracted {len(pdf_pages)} PDF pages from {url}")
+        return {"pdf_pages": pdf_pages, "pdf_title": title}
+    except PdfExtractionError as e:
+        logger.warning(f"Skipping {url} (PDF extraction failed: {e})")
+        return None
+    finally:
+        with suppress(FileNotFoundError):
+            os.remove(path)
+
+
+async def _fetch(client: httpx.AsyncClient, url: str) -> dict | None:
+    """
+    Fetching a URL according to its content type: HTML is read into memory,
+    PDFs are streamed to a temporary file, anything else is skipped unread.
+    Returning a dict with final_url, status, headers and either html or pdf_path.
+    """
+    async with client.stream("GET", url) as resp:
+        if resp.status_code != 200:
+            logger.warning(f"Skipping {url} (status {resp.status_code})")
+            return None
+
+        fetched = {"final_url": str(resp.url), "status": resp.status_code, "headers": dict(resp.headers)}
+        content_type = resp.headers.get("content-type", "").split(";")[0].strip().lower()
+
+        if content_type == "application/pdf" or urlparse(str(resp.url)).path.lower().endswith(".pdf"):
+            path = await _download_pdf(resp, url)
+            if path is None:
+                return None
+            fetched["pdf_path"] = path
+        elif content_type and content_type not in HTML_CONTENT_TYPES:
+            logger.info(f"Skipping {url} (content type {content_type})")
+            return None
+        else:
+            await resp.aread()
+            fetched["html"] = resp.text
+        return fetched
+
+
+def new_dedup_stats() -> dict:
+    """Counters for pages dropped by URL canonicalization and near-duplicate detection."""
+    return {
+        "duplicate_urls_skipped": 0,
+        "near_duplicate_pages_skipped": 0,
+        "pagination_pages_skipped": 0,
+    }
+
+
+def new_crawl_state() -> dict:
+    """Building a fresh crawl state seeded with the laws-regs and publications roots."""
+    return {
+        "to_visit": [
+            canonicalize_url(f"{OSHA_BASE_URL}{OSHA_LAWS_REGS_PATH}"),
+            canonicalize_url(f"{OSHA_BASE_URL}{OSHA_PUBLICATIONS_PATH}"),
+        ],
+        "visited": [],
+        "pages_crawled": 0,
+        "simhashes": [],
+        "dedup": new_dedup_stats(),
+        "pending_pdfs": [],
+    }
+
+
+def _fingerprint_text(page: dict) -> str:
+    """
+    Text used for near-duplicate fingerprints: the main content region when the
+    page has one, so site chrome outside it never makes distinct pages look alike.
+    Depends only on the page itself, never on what was crawled before it.
+    """
+    return page.get("main_text") or page["text"]
+
+
+async def iter_osha_pages(
+    max_pages: int = MAX_INGEST_PAGES,
+    state: dict | None = None,
+    job=None,
+    page_store: PageStore | None = None,
+):
+    """
+    Crawling OSHA laws-regs pages and yielding each page as soon as it is parsed.
+    PDFs are extracted in the background while crawling continues, up to
+    PDF_WORKERS at a time, and yielded in crawl order once extracted.
+    The frontier and visited set live in `state` so callers can checkpoint it
+    between pages and resume a crawl later. Stopping early if `job` is cancelled.
+    Every fetched response is also appended to `page_store` when one is given.
+
+    URLs are canonicalized before queueing, pagination pages are only mined for
+    links, and pages whose main content is a near-duplicate of one already
+    crawled are dropped; none of these count towards max_pages.
     """
     if not _check_robots_txt(OSHA_BASE_URL, OSHA_LAWS_REGS_PATH):
         logger.error("Crawling disallowed by robots.txt for laws-regs")
-        return []
+        return
 
     if not _check_robots_txt(OSHA_BASE_URL, OSHA_PUBLICATIONS_PATH):
         logger.error("Crawling disallowed by robots.txt for publications")
-        return []
-
-    visited = set()
-    to_visit = [
-        f"{OSHA_BASE_URL}{OSHA_LAWS_REGS_PATH}",
-        f"{OSHA_BASE_URL}{OSHA_PUBLICATIONS_PATH}",
-    ]
-    pages = []
+        return
+
+    if state is None:
+        state = new_crawl_state()
+    dedup = state.setdefault("dedup", new_dedup_stats())
+    near_duplicates = NearDuplicateIndex(state.setdefault("simhashes", []))
+
+    # PDFs still being extracted when the last checkpoint was taken are fetched again
+    retry = state.get("pending_pdfs", [])
+    if retry:
+        state["visited"] = [u for u in state["visited"] if u not in retry]
+        state["to_visit"][:0] = retry
+    state["pending_pdfs"] = []
+    visited = set(state["visited"])
+    to_visit = state["to_visit"]
+    queued = set(to_visit)
+    url_variants = set()
 
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -196,6 +443,58 @@ async def crawl_osha_pages(max_pages: int = MAX_INGEST_PAGES) -> list[dict]:
     if PROXY_ENABLED:
         logger.info(f"Using proxy for scraping: {PROXY_URL.split('@')[1] if '@' in PROXY_URL else PROXY_URL}")
 
+    def store(url: str, fetched: dict) -> None:
+        if page_store is not None:
+            page_store.append(
+                url,
+                fetched.get("html", ""),
+                headers=fetched["headers"],
+                status=fetched["status"],
+                pdf_pages=fetched.get("pdf_pages"),
+                pdf_title=fetched.get("pdf_title", ""),
+            )
+
+    def admit(url: str, page: dict) -> dict | None:
+        """Applying the pagination and near-duplicate filters, counting the pages that pass."""
+        if is_pagination_url(url):
+            dedup["pagination_pages_skipped"] += 1
+            return None
+        if near_duplicates.check_and_add(_fingerprint_text(page)):
+            dedup["near_duplicate_pages_skipped"] += 1
+            logger.info(f"Skipping near-duplicate page: {url}")
+            return None
+        state["simhashes"].append(near_duplicates.fingerprints[-1])
+        state["pages_crawled"] += 1
+        logger.info(f"Crawled: {url} ({len(page['text'])} chars)")
+        return page
+
+    async def finish_pdf(url: str, fetched: dict, task: asyncio.Task) -> dict | None:
+        try:
+            try:
+                extracted = await task
+            finally:
+                state["pending_pdfs"].remove(url)
+            if extracted is None:
+                return None
+            fetched.update(extracted)
+            store(url, fetched)
+            page = _build_pdf_page(url, fetched["pdf_pages"], fetched["pdf_title"])
+            return admit(url, page) if page is not None else None
+        except Exception as e:
+            logger.error(f"Error crawling {url}: {e}")
+            return None
+
+    # PDFs being extracted while the crawl goes on, oldest first, at most PDF_WORKERS at a time
+    pending: deque[tuple[str, dict, asyncio.Task]] = deque()
+
+    def can_fetch() -> bool:
+        # Pending PDFs count towards max_pages so the crawl never overshoots it
+        return (
+            bool(to_visit)
+            and state["pages_crawled"] + len(pending) < max_pages
+            and not (job is not None and job.cancel_requested)
+        )
+
     async with httpx.AsyncClient(
         timeout=30,
         follow_redirects=True,
@@ -203,76 +502,308 @@ async def crawl_osha_pages(max_pages: int = MAX_INGEST_PAGES) -> list[dict]:
         proxy=proxy,
         verify=not PROXY_ENABLED  # Disable SSL verification when using proxy
     ) as client:
-        while to_visit and len(pages) < max_pages:
-            url = to_visit.pop(0)
-            if url in visited:
-                continue
-            visited.add(url)
-
-            try:
-                resp = await client.get(url)
-                if resp.status_code != 200:
-                    logger.warning(f"Skipping {url} (status {resp.status_code})")
+        try:
+            while True:
+                # Collecting finished PDFs in crawl order, or waiting for one when every
+                # worker is busy or there is nothing else left to fetch
+                while pending and (pending[0][2].done() or len(pending) >= PDF_WORKERS or not can_fetch()):
+                    page = await finish_pdf(*pending.popleft())
+                    if page is not None:
+                        yield page
+
+                if not can_fetch():
+                    if job is not None and job.cancel_requested:
+                        logger.info("Crawl cancelled.")
+                    break
+
+                url = canonicalize_url(to_visit.pop(0))
+                queued.discard(url)
+                if url in visited:
+                    continue
+                visited.add(url)
+                state["visited"].append(url)
+
+                try:
+                    fetched = await _fetch(client, url)
+                    if fetched is None:
+                        continue
+
+                    # Redirects can land on a page already crawled under its canonical URL
+                    final_url = canonicalize_url(fetched["final_url"])
+                    if final_url != url:
+                        if final_url in visited:
+                            dedup["duplicate_urls_skipped"] += 1
+                            if "pdf_path" in fetched:
+                                os.remove(fetched["pdf_path"])
+                            continue
+                        visited.add(final_url)
+                        state["visited"].append(final_url)
+
+                    if "pdf_path" in fetched:
+                        # Extracting in the background; PDFs have no links to discover
+                        task = asyncio.create_task(_extract_pdf(fetched["pdf_path"], url))
+                        pending.append((url, fetched, task))
+                        state["pending_pdfs"].append(url)
+                        continue
+
+                    store(url, fetched)
+                    soup = BeautifulSoup(fetched["html"], "html.parser")
+                    page = _build_page(soup, url)
+                    if page is None:
+                        continue
+                    page = admit(url, page)
+
+                    # Discovering internal links under /laws-regs/ and /publications/
+                    for a_tag in soup.find_all("a", href=True):
+                        href = a_tag["href"]
+                        raw_url = urljoin(url, href)
+                        full_url = canonicalize_url(raw_url)
+                        parsed = urlparse(full_url)
+
+                        is_osha = "osha.gov" in parsed.netloc
+                        is_relevant = (
+                            parsed.path.startswith("/laws-regs")
+                            or parsed.path.startswith("/publications")
+                            # Publication PDFs are served from the Drupal files directory
+                            or (parsed.path.startswith("/sites/default/files/publications") and parsed.path.lower().endswith(".pdf"))
+                        )
+                        if not (is_osha and is_relevant):
+                            continue
+
+                        if full_url not in visited and full_url not in queued:
+                            to_visit.append(full_url)
+                            queued.add(full_url)
+                        elif raw_url != full_url and raw_url not in url_variants:
+                            # A variant spelling of a known page, counted once per variant
+                            url_variants.add(raw_url)
+                            dedup["duplicate_urls_skipped"] += 1
+
+                    if page is None:
+                        continue
+
+                    # Yielding last so the frontier already holds this page's links
+                    # whenever the caller checkpoints the state
+                    yield page
+
+                except Exception as e:
+                    logger.error(f"Error crawling {url}: {e}")
                     continue
+        finally:
+            # Closed early (cancelled or failed): abandoning extractions still in flight
+            for _, fetched, task in pending:
+                task.cancel()
+                # A task cancelled before it started never reaches its own cleanup
+                with suppress(FileNotFoundError):
+                    os.remove(fetched["pdf_path"])
+
+    logger.info(f"Crawling complete. Total pages: {state['pages_crawled']}")
+
+
+async def iter_stored_pages(
+    page_store: PageStore,
+    max_pages: int = MAX_INGEST_PAGES,
+    job=None,
+    dedup: dict | None = None,
+):
+    """
+    Replaying pages from the raw page store through cleaning, with no network access.
+    Yielding page dicts in the same shape as iter_osha_pages, with the same
+    canonical-URL, pagination and near-duplicate filtering.
+    """
+    if dedup is None:
+        dedup = new_dedup_stats()
+    near_duplicates = NearDuplicateIndex()
+    seen_urls = set()
+    yielded = 0
+    for record in page_store.iter_pages():
+        if yielded >= max_pages or (job is not None and job.cancel_requested):
+            break
+
+        url = canonicalize_url(record["url"])
+        if url in seen_urls:
+            dedup["duplicate_urls_skipped"] += 1
+            continue
+        seen_urls.add(url)
+        if is_pagination_url(url):
+            dedup["pagination_pages_skipped"] += 1
+            continue
+
+        # Parsing is CPU-bound; running it off the event loop keeps /chat responsive
+        page = await asyncio.to_thread(_page_from_record, record, url)
+        if page is None:
+            continue
+        if near_duplicates.check_and_add(_fingerprint_text(page)):
+            dedup["near_duplicate_pages_skipped"] += 1
+            logger.info(f"Skipping near-duplicate page: {url}")
+            continue
+        yielded += 1
+        yield page
+
+    logger.info(f"Reprocessing read {yielded} stored pages.")
+
+
+def _observe_stored_pages(page_store: PageStore, boilerplate: BoilerplateDetector) -> None:
+    """
+    Counting boilerplate over stored pages the detector has not seen yet, so a
+    reprocess filters with frequencies from the whole crawl rather than a prefix.
+    """
+    unseen = [url for url in page_store.urls() if not boilerplate.has_seen(url)]
+    for url in unseen:
+        record = page_store.get(url)
+        if record is None:
+            continue
+        page = _page_from_record(record, url)
+        if page is not None:
+            boilerplate.observe(url, page["text"])
+    if unseen:
+        logger.info(f"Counted boilerplate over {len(unseen)} stored pages")
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                metadata = _extract_page_metadata(soup, url)
-                clean_text = _clean_html(soup)
 
-                if len(clean_text.strip()) < 50:
-                    continue
+async def crawl_osha_pages(max_pages: int = MAX_INGEST_PAGES) -> list[dict]:
+    """
+    Crawling OSHA laws-regs pages starting from the base path.
+    Returning a list of dicts with 'url', 'text', and 'metadata' keys.
+    """
+    return [page async for page in iter_osha_pages(max_pages=max_pages)]
 
-                pages.append({
-                    "url": url,
-                    "text": clean_text,
-                    "metadata": metadata,
-                })
-                logger.info(f"Crawled: {url} ({len(clean_text)} chars)")
-
-                # Discovering internal links under /laws-regs/ and /publications/
-                for a_tag in soup.find_all("a", href=True):
-                    href = a_tag["href"]
-                    full_url = urljoin(url, href)
-                    parsed = urlparse(full_url)
-
-                    is_osha = "osha.gov" in parsed.netloc
-                    is_relevant = parsed.path.startswith("/laws-regs") or parsed.path.startswith("/publications")
-                    not_visited = full_url not in visited
-                    no_fragment = not parsed.fragment
-
-                    if is_osha and is_relevant and not_visited and no_fragment:
-                        to_visit.append(full_url)
-
-            except Exception as e:
-                logger.error(f"Error crawling {url}: {e}")
-                continue
 
-    logger.info(f"Crawling complete. Total pages: {len(pages)}")
-    return pages
+def _new_writer(job=None, collection_name: str = COLLECTION_NAME) -> QdrantUpsertWriter:
+    """Building an upsert writer that reports acknowledged points to the job."""
+    on_batch_written = (lambda count: job.record(chunks_upserted=count)) if job is not None else None
+    return QdrantUpsertWriter(collection_name, on_batch_written=on_batch_written)
+
 
+def _point_id(chunk_hash: str) -> str:
+    """Deriving a stable Qdrant point ID from the chunk hash so re-upserts overwrite."""
+    return str(uuid.UUID(chunk_hash[:32]))
 
-async def process_and_upsert(pages: list[dict]) -> dict:
+
+def _write_points(writer: QdrantUpsertWriter, documents: list[Document], indices: list[int], vectors) -> None:
+    """Handing embedded documents to the upsert writer in the retriever's payload layout."""
+    writer.add(
+        ids=[_point_id(documents[i].metadata["chunk_hash"]) for i in indices],
+        vectors=vectors,
+        payloads=[
+            {"page_content": documents[i].page_content, "metadata": documents[i].metadata}
+            for i in indices
+        ],
+    )
+
+
+def _embed_and_upsert(
+    documents: list[Document],
+    embeddings: LocalEmbeddings,
+    writer: QdrantUpsertWriter,
+    pool=None,
+    job=None,
+    cache: EmbeddingCache | None = None,
+) -> dict:
     """
-    Processing crawled pages: chunking, hashing for dedup, embedding, and upserting.
+    Embedding documents in length-sorted buckets and handing each bucket to the
+    upsert writer as soon as it is encoded (blocking). Payloads use the same
+    page_content/metadata layout as LangChain's QdrantVectorStore so the
+    retriever reads them unchanged. Chunks whose text is already in the
+    embedding cache skip the model entirely. Returning embedding stats.
+    """
+    texts = [doc.page_content for doc in documents]
+    to_embed = list(range(len(texts)))
+
+    if cache is not None:
+        hit_indices, hit_vectors, to_embed = cache.lookup(texts)
+        if hit_indices:
+            _write_points(writer, documents, hit_indices, hit_vectors)
+            if job is not None:
+                job.record(chunks_embed_cache_hits=len(hit_indices))
+
+    embed_seconds = 0.0
+    miss_texts = [texts[i] for i in to_embed]
+    batches = embeddings.iter_embedding_batches(miss_texts, batch_size=EMBED_BATCH_SIZE, pool=pool)
+    while True:
+        started = time.perf_counter()
+        batch = next(batches, None)
+        embed_seconds += time.perf_counter() - started
+        if batch is None:
+            break
+
+        miss_indices, vectors = batch
+        indices = [to_embed[i] for i in miss_indices]
+        if job is not None:
+            job.record(chunks_embedded=len(indices))
+        if cache is not None:
+            cache.add([texts[i] for i in indices], vectors)
+
+        _write_points(writer, documents, indices, vectors)
+
+    # Waiting for acknowledgements so a checkpoint never covers unsent points
+    writer.drain()
+
+    chunks_per_second = len(to_embed) / embed_seconds if embed_seconds > 0 else 0.0
+    logger.info(
+        f"Embedded {len(to_embed)} chunks in {embed_seconds:.1f}s ({chunks_per_second:.1f} chunks/sec), "
+        f"{len(texts) - len(to_embed)} from cache"
+    )
+    return {
+        "embed_seconds": embed_seconds,
+        "chunks_embedded": len(to_embed),
+        "chunks_embed_cache_hits": len(texts) - len(to_embed),
+    }
+
+
+async def process_and_upsert(
+    pages: list[dict],
+    existing_hashes: set | None = None,
+    job=None,
+    embeddings: LocalEmbeddings | None = None,
+    pool=None,
+    writer: QdrantUpsertWriter | None = None,
+    cache: EmbeddingCache | None = None,
+    collection_name: str = COLLECTION_NAME,
+    boilerplate: BoilerplateDetector | None = None,
+    replace_pages: bool = False,
+) -> dict:
+    """
+    Processing crawled pages: boilerplate removal, structure-aware chunking,
+    hashing for dedup, embedding, and upserting.
     Attaching rich metadata to each chunk for citation support.
+    With replace_pages=True, each page's previously stored chunks are deleted
+    first, so re-chunked pages never leave their old chunks behind.
     Returning stats dict with counts.
     """
-    from langchain_qdrant import QdrantVectorStore
-
-    embeddings = get_embeddings()
-    existing_hashes = _get_existing_hashes()
+    if embeddings is None:
+        embeddings = get_embeddings()
+    if cache is None and EMBED_CACHE_ENABLED:
+        cache = EmbeddingCache(embeddings.model_name)
+    if existing_hashes is None:
+        existing_hashes = _get_existing_hashes(collection_name)
+    owns_writer = writer is None
+    if owns_writer:
+        writer = _new_writer(job, collection_name)
+    if replace_pages and pages:
+        # Deleted synchronously before any new chunk is queued, so the upserts can never be overtaken
+        await asyncio.to_thread(_delete_page_points, [page["url"] for page in pages], collection_name)
 
     all_documents = []
     skipped = 0
 
+    boilerplate_dropped = 0
+
     for page in pages:
-        chunks = text_splitter.split_text(page["text"])
-        for i, chunk in enumerate(chunks):
+        # PDFs are chunked page by page so every chunk can cite its page number
+        chunks = []
+        for page_number, text in page.get("pdf_pages") or [(None, page["text"])]:
+            if boilerplate is not None:
+                text, dropped = boilerplate.strip(text)
+                boilerplate_dropped += dropped
+            chunks.extend({**chunk_info, "page_number": page_number} for chunk_info in chunk_page_text(text))
+
+        for i, chunk_info in enumerate(chunks):
+            chunk = chunk_info["text"]
             chunk_hash = _compute_chunk_hash(chunk, page["url"])
 
             if chunk_hash in existing_hashes:
                 skipped += 1
                 continue
+            existing_hashes.add(chunk_hash)
 
             # Building rich metadata for citations
             metadata = {
@@ -281,40 +812,188 @@ async def process_and_upsert(pages: list[dict]) -> dict:
                 "chunk_hash": chunk_hash,
                 "total_chunks": len(chunks),
             }
+            if chunk_info["section_path"]:
+                metadata["cfr_section"] = chunk_info["cfr_section"]
+                metadata["section_path"] = chunk_info["section_path"]
+                metadata["cfr_part"] = chunk_info["cfr_section"].split(".")[0]
+            if chunk_info["page_number"] is not None:
+                metadata["page_number"] = chunk_info["page_number"]
 
             doc = Document(page_content=chunk, metadata=metadata)
             all_documents.append(doc)
 
+    embed_stats = {"embed_seconds": 0.0, "chunks_embedded": 0, "chunks_embed_cache_hits": 0}
     if all_documents:
-        # Upserting via LangChain QdrantVectorStore
-        client = get_qdrant_client()
-        vector_store = QdrantVectorStore(
-            client=client,
-            collection_name=COLLECTION_NAME,
-            embedding=embeddings,
+        # Embedding off the event loop so /chat keeps responding during ingestion
+        embed_stats = await asyncio.to_thread(
+            _embed_and_upsert, all_documents, embeddings, writer, pool, job, cache
         )
-        vector_store.add_documents(documents=all_documents)
+    if owns_writer:
+        await asyncio.to_thread(writer.close)
+
+    if job is not None:
+        job.record(chunks_skipped_dedup=skipped)
 
     stats = {
         "pages_processed": len(pages),
         "chunks_added": len(all_documents),
         "chunks_skipped_dedup": skipped,
+        "boilerplate_lines_dropped": boilerplate_dropped,
+        "chunks_embedded": embed_stats["chunks_embedded"],
+        "chunks_embed_cache_hits": embed_stats["chunks_embed_cache_hits"],
+        "embed_seconds": round(embed_stats["embed_seconds"], 3),
     }
     logger.info(f"Ingestion stats: {stats}")
     return stats
 
 
-async def run_osha_ingestion(max_pages: int = MAX_INGEST_PAGES) -> dict:
+def load_checkpoint(path: str = INGEST_CHECKPOINT_PATH) -> dict | None:
+    """Loading a saved crawl checkpoint, returning None if there is none."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+
+
+def save_checkpoint(checkpoint: dict, path: str = INGEST_CHECKPOINT_PATH) -> None:
+    """Writing the checkpoint atomically so a crash never leaves a torn file."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def clear_checkpoint(path: str = INGEST_CHECKPOINT_PATH) -> None:
+    """Removing the checkpoint once a crawl has finished."""
+    if os.path.exists(path):
+        os.remove(path)
+
+
+async def run_osha_ingestion(
+    max_pages: int = MAX_INGEST_PAGES,
+    job=None,
+    resume: bool = True,
+    mode: str = "crawl",
+    collection_name: str = COLLECTION_NAME,
+    embed_processes: int = EMBED_PROCESSES,
+    pause_seconds: float = 0.0,
+) -> dict:
     """
     Full ingestion pipeline: crawl -> process -> upsert.
     Called by both the API endpoint and the weekly cron job.
+
+    Pages are processed in batches of INGEST_BATCH_PAGES. After each batch the
+    crawl frontier and visited set are checkpointed to disk, so a restarted
+    ingestion resumes where the previous one stopped instead of starting over.
+
+    mode="reprocess" skips the network entirely and replays pages from the raw
+    page store, for rebuilding the index after chunking or cleaning changes.
+    Each replayed page's old chunks are deleted before its new ones are written.
+    Background rebuilds pass pause_seconds to sleep between batches so serving
+    traffic keeps most of the CPU.
     """
-    logger.info("Starting OSHA ingestion pipeline...")
-    pages = await crawl_osha_pages(max_pages=max_pages)
-    if not pages:
+    if mode not in INGEST_MODES:
+        raise ValueError(f"Unknown ingestion mode: {mode}")
+
+    logger.info(f"Starting OSHA ingestion pipeline ({mode})...")
+
+    state = None
+    stats = {"pages_processed": 0, "chunks_added": 0, "chunks_skipped_dedup": 0}
+    if mode == "crawl":
+        checkpoint = load_checkpoint() if resume else None
+        if checkpoint and checkpoint.get("max_pages") == max_pages:
+            state = checkpoint["state"]
+            stats = checkpoint["stats"]
+            logger.info(
+                f"Resuming ingestion from checkpoint: {state['pages_crawled']} pages crawled, "
+                f"{len(state['to_visit'])} URLs in frontier"
+            )
+        else:
+            state = new_crawl_state()
+
+        if job is not None:
+            job.resume_from(state["pages_crawled"], stats)
+
+    page_store = PageStore() if PAGE_STORE_ENABLED or mode == "reprocess" else None
+    boilerplate = BoilerplateDetector()
+    if mode == "reprocess":
+        await asyncio.to_thread(_observe_stored_pages, page_store, boilerplate)
+        dedup = new_dedup_stats()
+        source = iter_stored_pages(page_store, max_pages=max_pages, job=job, dedup=dedup)
+    else:
+        dedup = state.setdefault("dedup", new_dedup_stats())
+        source = iter_osha_pages(max_pages=max_pages, state=state, job=job, page_store=page_store)
+
+    # Reprocessing replaces each page's chunks wholesale, so only dedup within this run
+    existing_hashes = set() if mode == "reprocess" else _get_existing_hashes(collection_name)
+    embeddings = get_embeddings()
+    cache = EmbeddingCache(embeddings.model_name) if EMBED_CACHE_ENABLED else None
+    pool = embeddings.start_pool(embed_processes)
+    writer = _new_writer(job, collection_name)
+    batch = []
+
+    async def flush():
+        batch_stats = await process_and_upsert(
+            batch,
+            existing_hashes=existing_hashes,
+            job=job,
+            embeddings=embeddings,
+            pool=pool,
+            writer=writer,
+            cache=cache,
+            collection_name=collection_name,
+            boilerplate=boilerplate,
+            replace_pages=mode == "reprocess",
+        )
+        for key, value in batch_stats.items():
+            stats[key] = stats.get(key, 0) + value
+        batch.clear()
+        boilerplate.save()
+        if state is not None:
+            save_checkpoint({"max_pages": max_pages, "state": state, "stats": stats})
+        if pause_seconds:
+            await asyncio.sleep(pause_seconds)
+
+    try:
+        async with aclosing(source) as pages:
+            async for page in pages:
+                # Observing at crawl time so a whole batch is counted before any of it is filtered
+                boilerplate.observe(page["url"], page["text"])
+                batch.append(page)
+                if job is not None:
+                    job.record(pages_crawled=1)
+                if len(batch) >= INGEST_BATCH_PAGES:
+                    await flush()
+                if job is not None and job.cancel_requested:
+                    break
+
+        if batch:
+            await flush()
+        await asyncio.to_thread(writer.close)
+    finally:
+        writer.shutdown()
+        embeddings.stop_pool(pool)
+        if page_store is not None:
+            page_store.close()
+
+    stats.update(dedup)
+    if stats.get("embed_seconds"):
+        stats["embed_chunks_per_second"] = round(stats["chunks_embedded"] / stats["embed_seconds"], 1)
+
+    if job is not None and job.cancel_requested:
+        logger.info(f"Ingestion cancelled: {stats}")
+        return stats
+
+    if mode == "crawl":
+        clear_checkpoint()
+    if not stats["pages_processed"]:
         logger.warning("No pages crawled. Ingestion skipped.")
-        return {"pages_processed": 0, "chunks_added": 0, "chunks_skipped_dedup": 0}
+        return stats
 
-    stats = await process_and_upsert(pages)
     logger.info(f"Ingestion complete: {stats}")
     return stats
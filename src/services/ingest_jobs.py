@@ -0,0 +1,186 @@
+"""
+Ingestion job manager.
+Tracking OSHA ingestion runs by job ID with live progress, cooperative
+cancellation, and a single-active-job guarantee so overlapping crawls
+never compete with /chat for CPU.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+
+from src.config import MAX_INGEST_PAGES
+from src.services.ingest import INGEST_MODES, run_osha_ingestion
+from src.services.rebuild import run_collection_rebuild
+
+logger = logging.getLogger(__name__)
+
+# Ingestion source modes plus "rebuild", a blue/green rebuild into a new collection
+JOB_MODES = INGEST_MODES + ("rebuild",)
+
+ACTIVE_STATUSES = ("pending", "running", "cancelling")
+
+
+class IngestJobConflict(Exception):
+    """Raised when a job is requested while another one is still active."""
+
+    def __init__(self, active_job_id: str):
+        super().__init__(f"Ingestion job {active_job_id} is already running")
+        self.active_job_id = active_job_id
+
+
+class IngestJob:
+    """Progress and lifecycle state of a single ingestion run."""
+
+    def __init__(self, max_pages: int = MAX_INGEST_PAGES, mode: str = "crawl"):
+        self.id = uuid.uuid4().hex
+        self.max_pages = max_pages
+        self.mode = mode
+        self.status = "pending"
+        self.error: str | None = None
+        self.cancel_requested = False
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.resumed_pages = 0
+        self.resumed_chunks = 0
+        self.progress = {
+            "pages_crawled": 0,
+            "chunks_embedded": 0,
+            "chunks_embed_cache_hits": 0,
+            "chunks_upserted": 0,
+            "chunks_skipped_dedup": 0,
+        }
+        self.stats: dict = {}
+
+    def resume_from(self, pages_crawled: int, stats: dict):
+        """Seeding progress with counts carried over from a checkpoint."""
+        self.resumed_pages = pages_crawled
+        self.resumed_chunks = stats.get("chunks_embedded", 0)
+        self.progress["pages_crawled"] = pages_crawled
+        self.progress["chunks_upserted"] = stats.get("chunks_added", 0)
+        self.progress["chunks_embedded"] = stats.get("chunks_embedded", 0)
+        self.progress["chunks_embed_cache_hits"] = stats.get("chunks_embed_cache_hits", 0)
+        self.progress["chunks_skipped_dedup"] = stats.get("chunks_skipped_dedup", 0)
+
+    def record(self, **counts: int):
+        """Incrementing progress counters."""
+        for key, value in counts.items():
+            self.progress[key] = self.progress.get(key, 0) + value
+
+    def cancel(self):
+        """Requesting cooperative cancellation at the next page or batch boundary."""
+        if self.status in ACTIVE_STATUSES:
+            self.cancel_requested = True
+            self.status = "cancelling"
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    def to_dict(self) -> dict:
+        """Serializing the job with derived rate and ETA for the status endpoint."""
+        elapsed = 0.0
+        if self.started_at:
+            elapsed = (self.finished_at or time.time()) - self.started_at
+
+        # Rates only count work done by this run, not counts restored from a checkpoint
+        pages_this_run = self.progress["pages_crawled"] - self.resumed_pages
+        chunks_this_run = self.progress["chunks_embedded"] - self.resumed_chunks
+        pages_per_second = pages_this_run / elapsed if elapsed > 0 else 0.0
+        chunks_per_second = chunks_this_run / elapsed if elapsed > 0 else 0.0
+
+        eta_seconds = None
+        if self.is_active and pages_per_second > 0:
+            remaining = max(self.max_pages - self.progress["pages_crawled"], 0)
+            eta_seconds = round(remaining / pages_per_second, 1)
+
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "mode": self.mode,
+            "max_pages": self.max_pages,
+            "progress": dict(self.progress),
+            "rate": {
+                "pages_per_second": round(pages_per_second, 3),
+                "chunks_per_second": round(chunks_per_second, 3),
+            },
+            "eta_seconds": eta_seconds,
+            "elapsed_seconds": round(elapsed, 1),
+            "resumed_from_checkpoint": self.resumed_pages > 0,
+            "stats": self.stats,
+            "error": self.error,
+        }
+
+
+class IngestJobManager:
+    """Running at most one ingestion job at a time and remembering recent ones."""
+
+    def __init__(self, max_history: int = 20):
+        self._jobs: OrderedDict[str, IngestJob] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._max_history = max_history
+
+    @property
+    def active_job(self) -> IngestJob | None:
+        for job in self._jobs.values():
+            if job.is_active:
+                return job
+        return None
+
+    def start(self, max_pages: int = MAX_INGEST_PAGES, resume: bool = True, mode: str = "crawl") -> IngestJob:
+        """Starting a new ingestion job on the running event loop."""
+        if mode not in JOB_MODES:
+            raise ValueError(f"Unknown ingestion mode: {mode}")
+
+        active = self.active_job
+        if active is not None:
+            raise IngestJobConflict(active.id)
+
+        job = IngestJob(max_pages=max_pages, mode=mode)
+        self._jobs[job.id] = job
+        while len(self._jobs) > self._max_history:
+            self._jobs.popitem(last=False)
+
+        # Keeping a reference so the task is not garbage collected mid-run
+        self._tasks[job.id] = asyncio.create_task(self._run(job, resume))
+        return job
+
+    def get(self, job_id: str) -> IngestJob | None:
+        return self._jobs.get(job_id)
+
+    def list(self) -> list[IngestJob]:
+        return list(reversed(self._jobs.values()))
+
+    def cancel(self, job_id: str) -> IngestJob | None:
+        job = self._jobs.get(job_id)
+        if job is not None:
+            job.cancel()
+        return job
+
+    async def _run(self, job: IngestJob, resume: bool):
+        if not job.cancel_requested:
+            job.status = "running"
+        job.started_at = time.time()
+        logger.info(f"Ingestion job {job.id} started (mode={job.mode}, max_pages={job.max_pages})")
+        try:
+            if job.mode == "rebuild":
+                job.stats = await run_collection_rebuild(job=job)
+            else:
+                job.stats = await run_osha_ingestion(
+                    max_pages=job.max_pages, job=job, resume=resume, mode=job.mode
+                )
+            job.status = "cancelled" if job.cancel_requested else "completed"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.exception(f"Ingestion job {job.id} failed")
+        finally:
+            job.finished_at = time.time()
+            self._tasks.pop(job.id, None)
+            logger.info(f"Ingestion job {job.id} finished with status {job.status}")
+
+
+# Shared job manager instance
+job_manager = IngestJobManager()
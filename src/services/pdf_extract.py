@@ -0,0 +1,101 @@
+"""
+Sandboxed PDF text extraction.
+Extracting text page by page in short-lived spawned worker processes with a
+memory cap and a per-document timeout, so a malformed or hostile PDF can
+only ever take down its own worker, never the API process.
+"""
+import asyncio
+import logging
+import multiprocessing
+import time
+
+from src.config import PDF_MAX_PAGES, PDF_MEMORY_LIMIT_BYTES, PDF_TIMEOUT_SECONDS, PDF_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# Spawned, not forked: the parent holds the embedding model and worker threads
+_context = multiprocessing.get_context("spawn")
+
+# Bounding concurrent extraction processes
+_worker_slots = asyncio.Semaphore(PDF_WORKERS)
+
+
+class PdfExtractionError(Exception):
+    """Raised when a PDF cannot be extracted within its limits."""
+
+
+def _extract_worker(path: str, conn, max_pages: int, memory_limit: int) -> None:
+    """Child process entry point: streaming ("page", number, text) messages back to the parent."""
+    try:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    except (ImportError, ValueError, OSError):
+        pass
+
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(path)
+        title = ""
+        if reader.metadata and reader.metadata.title:
+            title = str(reader.metadata.title)
+        conn.send(("meta", title))
+        for number, page in enumerate(reader.pages, start=1):
+            if number > max_pages:
+                break
+            conn.send(("page", number, page.extract_text() or ""))
+        conn.send(("done",))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def _run_extraction(path: str, timeout: float) -> tuple[list[list], str]:
+    """Running one worker to completion or deadline (blocking). Returning (pages, title)."""
+    parent_conn, child_conn = _context.Pipe(duplex=False)
+    process = _context.Process(
+        target=_extract_worker,
+        args=(path, child_conn, PDF_MAX_PAGES, PDF_MEMORY_LIMIT_BYTES),
+        daemon=True,
+    )
+    process.start()
+    child_conn.close()
+
+    deadline = time.monotonic() + timeout
+    pages, title = [], ""
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not parent_conn.poll(remaining):
+                raise PdfExtractionError(f"timed out after {timeout:.0f}s")
+            try:
+                message = parent_conn.recv()
+            except EOFError:
+                process.join(timeout=5)
+                raise PdfExtractionError(f"worker exited with code {process.exitcode}")
+
+            kind = message[0]
+            if kind == "meta":
+                title = message[1]
+            elif kind == "page":
+                pages.append([message[1], message[2]])
+            elif kind == "error":
+                raise PdfExtractionError(message[1])
+            else:
+                return pages, title
+    finally:
+        parent_conn.close()
+        if process.is_alive():
+            process.terminate()
+        process.join(timeout=5)
+
+
+async def extract_pdf_pages(path: str, timeout: float = PDF_TIMEOUT_SECONDS) -> tuple[list[list], str]:
+    """
+    Extracting [page_number, text] pairs and the document title from a PDF file.
+    Raising PdfExtractionError on timeout, worker crash, or parse failure.
+    """
+    async with _worker_slots:
+        return await asyncio.to_thread(_run_extraction, path, timeout)
@@ -6,6 +6,7 @@ Supports conversation history for contextual responses.
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_qdrant import QdrantVectorStore
+from qdrant_client.http.models import FieldCondition, Filter, MatchAny
 from typing import Optional
 
 from src.config import COLLECTION_NAME
@@ -78,6 +79,8 @@ def _format_docs_with_citations(docs) -> str:
             header += f" Title: {page_title}"
         if section:
             header += f" | Section: {section}"
+        if doc.metadata.get("page_number"):
+            header += f" | Page: {doc.metadata['page_number']}"
         header += f"\nSource: {source_url}"
 
         formatted_parts.append(f"{header}\n{doc.page_content}")
@@ -113,24 +116,54 @@ def _format_history(history: list) -> str:
     return "\n".join(formatted_lines)
 
 
+def _citation(metadata: dict) -> dict:
+    """Building the citation for one chunk from its metadata."""
+    url = metadata.get("source_url", "")
+    # PDF chunks link straight to their page
+    if url and metadata.get("page_number"):
+        url = f"{url}#page={metadata['page_number']}"
+    return {
+        "url": url,
+        "title": metadata.get("page_title", ""),
+        "section": metadata.get("section_heading", ""),
+    }
+
+
 def _extract_citations(docs) -> list[dict]:
     """Extracting unique citation info from retrieved documents."""
     seen_urls = set()
     citations = []
     for doc in docs:
-        url = doc.metadata.get("source_url", "")
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            citations.append({
-                "url": url,
-                "title": doc.metadata.get("page_title", ""),
-                "section": doc.metadata.get("section_heading", ""),
-            })
+        citation = _citation(doc.metadata)
+        if citation["url"] and citation["url"] not in seen_urls:
+            seen_urls.add(citation["url"])
+            citations.append(citation)
     return citations
 
 
-def get_retriever(k: int = 5):
-    """Building a Qdrant retriever for similarity search."""
+# Request filter names mapped to indexed payload fields
+FILTER_FIELDS = {
+    "cfr_part": "metadata.cfr_part",
+    "content_type": "metadata.content_type",
+}
+
+
+def _build_filter(filters: Optional[dict]) -> Optional[Filter]:
+    """Turning {"cfr_part": ["1926"], "content_type": [...]} into a Qdrant payload filter."""
+    if not filters:
+        return None
+
+    conditions = []
+    for name, values in filters.items():
+        if name not in FILTER_FIELDS:
+            raise ValueError(f"Unknown filter: {name}")
+        if values:
+            conditions.append(FieldCondition(key=FILTER_FIELDS[name], match=MatchAny(any=list(values))))
+    return Filter(must=conditions) if conditions else None
+
+
+def get_retriever(k: int = 5, filters: Optional[dict] = None):
+    """Building a Qdrant retriever for similarity search, optionally scoped by payload filters."""
     client = get_qdrant_client()
     embeddings = get_embeddings()
     vector_store = QdrantVectorStore(
@@ -138,10 +171,53 @@ def get_retriever(k: int = 5):
         collection_name=COLLECTION_NAME,
         embedding=embeddings,
     )
-    return vector_store.as_retriever(search_kwargs={"k": k})
-
+    search_kwargs = {"k": k}
+    payload_filter = _build_filter(filters)
+    if payload_filter is not None:
+        search_kwargs["filter"] = payload_filter
+    return vector_store.as_retriever(search_kwargs=search_kwargs)
+
+
+def search_chunks(
+    query: str,
+    limit: int = 10,
+    offset: int = 0,
+    filters: Optional[dict] = None,
+) -> dict:
+    """
+    Retrieval without generation: embedding the query and fetching one page of
+    ranked chunks with their similarity scores, metadata and citations.
+    Blocking; callers on the event loop should run it in a thread.
+    """
+    vector = get_embeddings().embed_query(query)
+    response = get_qdrant_client().query_points(
+        collection_name=COLLECTION_NAME,
+        query=vector,
+        query_filter=_build_filter(filters),
+        limit=limit + 1,  # One extra point tells whether another page exists
+        offset=offset,
+        with_payload=True,
+    )
 
-async def query_rag_chain(question: str, history: Optional[list[dict]] = None) -> dict:
+    results = []
+    for rank, point in enumerate(response.points[:limit], start=offset + 1):
+        payload = point.payload or {}
+        metadata = payload.get("metadata", {})
+        results.append({
+            "rank": rank,
+            "score": round(point.score, 4),
+            "text": payload.get("page_content", ""),
+            "metadata": metadata,
+            "citation": _citation(metadata),
+        })
+    return {"results": results, "has_more": len(response.points) > limit}
+
+
+async def query_rag_chain(
+    question: str,
+    history: Optional[list[dict]] = None,
+    filters: Optional[dict] = None,
+) -> dict:
     """
     Running RAG pipeline: retrieve -> format context -> generate answer.
     Returns the answer and citation list.
@@ -150,8 +226,9 @@ async def query_rag_chain(question: str, history: Optional[list[dict]] = None) -
         question: The user's current question
         history: List of previous messages (max last 5 used)
                  Format: [{"role": "user", "content": "..."}, {"role": "assistant", "content": "..."}]
+        filters: Optional payload filters, e.g. {"cfr_part": ["1926"], "content_type": ["regulation"]}
     """
-    retriever = get_retriever()
+    retriever = get_retriever(filters=filters)
     llm = get_groq_llm()
 
     docs = await retriever.ainvoke(question)
@@ -0,0 +1,126 @@
+"""
+Zero-downtime blue/green collection rebuilds.
+Building a fresh versioned collection from the raw page store in the
+background, validating it with sanity queries, then atomically moving the
+COLLECTION_NAME alias the retriever reads from and dropping the old version.
+"""
+import asyncio
+import logging
+
+from src.config import (
+    COLLECTION_NAME,
+    REBUILD_MIN_POINTS_RATIO,
+    REBUILD_MIN_SCORE,
+    REBUILD_PAUSE_SECONDS,
+    REBUILD_SANITY_QUERIES,
+)
+from src.db.page_store import PageStore
+from src.db.qdrant_client import (
+    AliasSwapError,
+    create_versioned_collection,
+    get_qdrant_client,
+    resolve_alias,
+    swap_alias,
+)
+from src.services.embeddings_local import get_embeddings
+from src.services.ingest import run_osha_ingestion
+
+logger = logging.getLogger(__name__)
+
+
+class RebuildError(Exception):
+    """Raised when a rebuild cannot start or its new collection fails validation."""
+
+
+def _validate_collection(collection_name: str) -> dict:
+    """
+    Checking the new collection before it goes live: it must hold a reasonable
+    share of the live collection's points, and every sanity query must return
+    a hit above REBUILD_MIN_SCORE. Raising RebuildError on failure.
+    """
+    client = get_qdrant_client()
+    new_count = client.count(collection_name, exact=True).count
+
+    live_count = 0
+    live = resolve_alias(COLLECTION_NAME) or COLLECTION_NAME
+    existing = [c.name for c in client.get_collections().collections]
+    if live in existing:
+        live_count = client.count(live, exact=True).count
+
+    if new_count == 0 or new_count < live_count * REBUILD_MIN_POINTS_RATIO:
+        raise RebuildError(f"New collection has {new_count} points, live collection has {live_count}")
+
+    embeddings = get_embeddings()
+    queries = {}
+    for query in REBUILD_SANITY_QUERIES:
+        hits = client.query_points(
+            collection_name=collection_name,
+            query=embeddings.embed_query(query),
+            limit=1,
+        ).points
+        top_score = hits[0].score if hits else 0.0
+        queries[query] = round(top_score, 4)
+        if top_score < REBUILD_MIN_SCORE:
+            raise RebuildError(f"Sanity query {query!r} scored {top_score:.3f} on {collection_name}")
+
+    return {"points": new_count, "live_points": live_count, "sanity_scores": queries}
+
+
+async def run_collection_rebuild(job=None) -> dict:
+    """
+    Rebuilding the index into a new collection without touching the live one.
+    The live alias only moves once the new collection passes validation; on
+    failure or cancellation the new collection is dropped and serving is unaffected.
+    The one exception is a failed legacy migration in swap_alias, where the new
+    collection is kept because the old one is already gone.
+    """
+    page_store = PageStore()
+    total_pages = len(page_store)
+    page_store.close()
+    if total_pages == 0:
+        raise RebuildError("Raw page store is empty; run a crawl before rebuilding")
+
+    if job is not None:
+        job.max_pages = total_pages
+
+    client = get_qdrant_client()
+    new_collection = create_versioned_collection()
+    logger.info(f"Rebuilding {total_pages} stored pages into {new_collection}...")
+
+    try:
+        # Single-process embedding plus a pause between batches keeps /chat responsive
+        stats = await run_osha_ingestion(
+            max_pages=total_pages,
+            job=job,
+            mode="reprocess",
+            collection_name=new_collection,
+            embed_processes=1,
+            pause_seconds=REBUILD_PAUSE_SECONDS,
+        )
+        if job is not None and job.cancel_requested:
+            logger.info(f"Rebuild cancelled, dropping {new_collection}")
+            client.delete_collection(new_collection)
+            return stats
+
+        stats["validation"] = await asyncio.to_thread(_validate_collection, new_collection)
+        previous = await asyncio.to_thread(swap_alias, new_collection)
+    except AliasSwapError as e:
+        # The legacy live collection is already deleted; the new one now holds the only index
+        logger.critical(
+            f"{e}. Keeping {new_collection}; /chat has no data until the {COLLECTION_NAME} "
+            f"alias is pointed at it manually."
+        )
+        raise
+    except BaseException:
+        logger.warning(f"Rebuild did not complete, dropping {new_collection}")
+        client.delete_collection(new_collection)
+        raise
+
+    if previous is not None and previous != new_collection:
+        client.delete_collection(previous)
+        logger.info(f"Dropped previous collection {previous}")
+
+    stats["collection"] = new_collection
+    stats["previous_collection"] = previous
+    logger.info(f"Rebuild complete, {COLLECTION_NAME} -> {new_collection}: {stats}")
+    return stats
@@ -0,0 +1,90 @@
+"""
+Admission control for LLM-bound chat traffic.
+Capping concurrent generations and queueing a bounded number of waiters with
+a per-request deadline, so traffic spikes get fast 429s instead of piling up
+Groq calls that all slow down and trip upstream rate limits.
+"""
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+
+from src.config import CHAT_MAX_CONCURRENT, CHAT_MAX_QUEUE, CHAT_QUEUE_TIMEOUT_SECONDS
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted; carries a Retry-After hint in seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Semaphore-based limiter with a bounded wait queue and rejection metrics."""
+
+    def __init__(
+        self,
+        max_concurrent: int = CHAT_MAX_CONCURRENT,
+        max_queue: int = CHAT_MAX_QUEUE,
+        queue_timeout: float = CHAT_QUEUE_TIMEOUT_SECONDS,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self._avg_seconds = 2.0  # Moving average of generation time, seeded with a typical Groq call
+
+    def _retry_after(self) -> int:
+        """Estimating how long until a slot frees up for a new request."""
+        backlog = (max(self.active + self.waiting - self.max_concurrent, 0) + 1) / self.max_concurrent
+        return max(1, math.ceil(backlog * self._avg_seconds))
+
+    @asynccontextmanager
+    async def admit(self):
+        """Holding a generation slot for the duration of the block, or raising AdmissionRejected."""
+        # Counting waiters rather than checking the semaphore, which wait_for acquires lazily
+        if self.active + self.waiting >= self.max_concurrent + self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected("queue full", self._retry_after())
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected_timeout += 1
+            raise AdmissionRejected("queue timeout", self._retry_after())
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        self.admitted += 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+            self._avg_seconds = 0.9 * self._avg_seconds + 0.1 * (time.monotonic() - started)
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "avg_generation_seconds": round(self._avg_seconds, 3),
+        }
+
+
+# Shared admission controller for /chat
+chat_admission = AdmissionController()
@@ -53,3 +53,6 @@ class LRUCache:
 
 # Shared cache instance (1 hour TTL, 256 entries max)
 retrieval_cache = LRUCache(max_size=256, ttl_seconds=3600)
+
+# Shared cache for /search result pages (cheap to recompute, so more entries per TTL)
+search_cache = LRUCache(max_size=1024, ttl_seconds=3600)
@@ -0,0 +1,118 @@
+"""
+Persistent content-addressed embedding cache.
+Keying vectors by a hash of the model ID and chunk text, so unchanged text is
+never re-embedded, whatever URL it was published under. Vectors live in a
+memory-mapped float32 matrix with a compact digest -> row index beside it.
+"""
+import hashlib
+import logging
+import os
+import re
+
+import numpy as np
+
+from src.config import EMBED_CACHE_DIR, EMBEDDING_DIM
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_SIZE = 16  # bytes of blake2b digest stored per row
+
+
+class EmbeddingCache:
+    """
+    Append-only vector cache for a single embedding model.
+    vectors.f32 holds raw float32 rows and keys.bin the matching digests in row
+    order. Vectors are written before keys, so a crash can only leave an
+    unreferenced trailing vector, never a key pointing at a missing row.
+    """
+
+    def __init__(self, model_id: str, directory: str = EMBED_CACHE_DIR, dim: int = EMBEDDING_DIM):
+        self.model_id = model_id
+        self.dim = dim
+        self.directory = os.path.join(directory, re.sub(r"[^A-Za-z0-9_.-]", "_", model_id))
+        self.vectors_path = os.path.join(self.directory, "vectors.f32")
+        self.keys_path = os.path.join(self.directory, "keys.bin")
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._rows: dict[bytes, int] = {}
+        self._matrix: np.memmap | None = None
+        self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def key(self, text: str) -> bytes:
+        """Hashing the model ID with the text, so switching models never returns stale vectors."""
+        h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+        h.update(self.model_id.encode())
+        h.update(b"\0")
+        h.update(text.encode())
+        return h.digest()
+
+    def lookup(self, texts: list[str]) -> tuple[list[int], np.ndarray, list[int]]:
+        """
+        Splitting texts into cache hits and misses.
+        Returning (hit indices, float32 matrix of hit vectors, miss indices).
+        """
+        hit_indices, hit_rows, miss_indices = [], [], []
+        for i, text in enumerate(texts):
+            row = self._rows.get(self.key(text))
+            if row is None:
+                miss_indices.append(i)
+            else:
+                hit_indices.append(i)
+                hit_rows.append(row)
+
+        if not hit_rows:
+            return hit_indices, np.empty((0, self.dim), dtype=np.float32), miss_indices
+        return hit_indices, np.asarray(self._map()[hit_rows], dtype=np.float32), miss_indices
+
+    def add(self, texts: list[str], vectors: np.ndarray) -> None:
+        """Appending vectors for texts not already cached."""
+        pending: dict[bytes, np.ndarray] = {}
+        for text, vector in zip(texts, vectors):
+            key = self.key(text)
+            if key not in self._rows:
+                pending.setdefault(key, vector)
+        if not pending:
+            return
+
+        new_keys, new_rows = list(pending), list(pending.values())
+        first_row = len(self._rows)
+        with open(self.vectors_path, "ab") as f:
+            f.write(np.asarray(new_rows, dtype=np.float32).tobytes())
+        with open(self.keys_path, "ab") as f:
+            f.write(b"".join(new_keys))
+
+        for offset, key in enumerate(new_keys):
+            self._rows[key] = first_row + offset
+        # Dropping the map so the next lookup re-maps the grown file
+        self._matrix = None
+
+    def _map(self) -> np.memmap:
+        if self._matrix is None:
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(len(self._rows), self.dim))
+        return self._matrix
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self.vectors_path):
+            return
+
+        keys = b""
+        if os.path.exists(self.keys_path):
+            with open(self.keys_path, "rb") as f:
+                keys = f.read()
+        vectors_size = os.path.getsize(self.vectors_path)
+        rows = min(len(keys) // _DIGEST_SIZE, vectors_size // (self.dim * 4))
+
+        for row in range(rows):
+            self._rows[keys[row * _DIGEST_SIZE:(row + 1) * _DIGEST_SIZE]] = row
+
+        # Truncating torn tails so new rows line up with their keys again
+        if len(keys) != rows * _DIGEST_SIZE:
+            with open(self.keys_path, "r+b") as f:
+                f.truncate(rows * _DIGEST_SIZE)
+        if vectors_size != rows * self.dim * 4:
+            with open(self.vectors_path, "r+b") as f:
+                f.truncate(rows * self.dim * 4)
+        logger.info(f"Loaded embedding cache for {self.model_id}: {rows} vectors")
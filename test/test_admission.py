@@ -0,0 +1,50 @@
+"""
+Tests for /chat admission control.
+"""
+import asyncio
+
+import pytest
+
+from src.utils.admission import AdmissionController, AdmissionRejected
+
+
+def test_rejects_when_slots_and_queue_are_full():
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=5)
+        release = asyncio.Event()
+
+        async def hold():
+            async with controller.admit():
+                await release.wait()
+
+        holders = [asyncio.create_task(hold()) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as rejected:
+            async with controller.admit():
+                pass
+        assert rejected.value.reason == "queue full"
+        assert rejected.value.retry_after >= 1
+
+        release.set()
+        await asyncio.gather(*holders)
+        return controller.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["admitted"] == 2
+    assert stats["rejected_queue_full"] == 1
+    assert stats["active"] == stats["queue_depth"] == 0
+
+
+def test_rejects_after_queue_timeout():
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=5, queue_timeout=0.05)
+        async with controller.admit():
+            with pytest.raises(AdmissionRejected) as rejected:
+                async with controller.admit():
+                    pass
+        return rejected.value, controller.stats()
+
+    rejected, stats = asyncio.run(scenario())
+    assert rejected.reason == "queue timeout"
+    assert stats["rejected_timeout"] == 1
+    assert stats["queue_depth"] == 0
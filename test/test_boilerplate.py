@@ -0,0 +1,58 @@
+"""
+Tests for cross-page boilerplate detection.
+"""
+from src.services.boilerplate import BoilerplateDetector
+
+SIDEBAR = "Skip to main content of this website"
+
+
+def _detector(tmp_path, **kwargs) -> BoilerplateDetector:
+    kwargs.setdefault("min_pages", 3)
+    kwargs.setdefault("min_fraction", 0.5)
+    return BoilerplateDetector(path=str(tmp_path / "boilerplate.json"), **kwargs)
+
+
+def test_lines_on_most_pages_are_stripped(tmp_path):
+    detector = _detector(tmp_path)
+    for i in range(10):
+        detector.observe(f"https://www.osha.gov/p{i}", f"{SIDEBAR}\nUnique body text for page number {i}")
+
+    text, dropped = detector.strip(f"{SIDEBAR}\nUnique body text for page number 3")
+    assert dropped == 1
+    assert text == "Unique body text for page number 3"
+
+
+def test_threshold_scales_with_observed_pages(tmp_path):
+    detector = _detector(tmp_path)
+    for i in range(4):
+        detector.observe(f"https://www.osha.gov/a{i}", f"Repeated in a few interpretation letters\nbody {i}")
+    for i in range(20):
+        detector.observe(f"https://www.osha.gov/b{i}", f"Another page body with its own text {i}")
+
+    assert detector.threshold() == 12
+    assert detector.strip("Repeated in a few interpretation letters")[1] == 0
+
+
+def test_regulation_lines_are_never_stripped(tmp_path):
+    detector = _detector(tmp_path)
+    quoted = "(a) General requirements apply to all employers."
+    reference = "1910.132(a) Protective equipment shall be provided."
+    for i in range(10):
+        detector.observe(f"https://www.osha.gov/p{i}", f"{quoted}\n{reference}")
+
+    assert detector.strip(f"{quoted}\n{reference}") == (f"{quoted}\n{reference}", 0)
+
+
+def test_pages_are_counted_once_and_counts_persist(tmp_path):
+    detector = _detector(tmp_path, min_fraction=0.0)
+    for _ in range(5):
+        detector.observe("https://www.osha.gov/same", SIDEBAR)
+    assert detector.strip(SIDEBAR)[1] == 0
+
+    for i in range(3):
+        detector.observe(f"https://www.osha.gov/p{i}", SIDEBAR)
+    detector.save()
+
+    reloaded = _detector(tmp_path, min_fraction=0.0)
+    assert reloaded.has_seen("https://www.osha.gov/p0")
+    assert reloaded.strip(SIDEBAR)[1] == 1
@@ -0,0 +1,78 @@
+"""
+Tests for structure-aware CFR chunking.
+"""
+from src.services.chunking import _split_paragraphs, chunk_page_text
+
+
+def _paths(text: str) -> list[str]:
+    return [ref for _, ref, _ in _split_paragraphs(text)]
+
+
+def test_nested_designators_build_full_paths():
+    text = "1910.132(a) Application.\n(1) Hazards.\n(i) Select.\n(A) Type.\n(b) Assessment."
+    assert _paths(text) == [
+        "1910.132(a)",
+        "1910.132(a)(1)",
+        "1910.132(a)(1)(i)",
+        "1910.132(a)(1)(i)(A)",
+        "1910.132(b)",
+    ]
+
+
+def test_letter_after_roman_numerals_returns_to_top_level():
+    text = (
+        "1926.501 - Duty to have fall protection.\n"
+        "(b) Fall protection.\n"
+        "(13) Residential construction.\n"
+        "(i) First.\n"
+        "(ii) Second.\n"
+        "(c) Protection from falling objects.\n"
+        "(1) Toeboards.\n"
+        "(i) Screens.\n"
+        "(ii) Canopies."
+    )
+    assert _paths(text)[-5:] == [
+        "1926.501(b)(13)(ii)",
+        "1926.501(c)",
+        "1926.501(c)(1)",
+        "1926.501(c)(1)(i)",
+        "1926.501(c)(1)(ii)",
+    ]
+
+
+def test_roman_numerals_continue_past_ambiguous_letters():
+    text = "1910.1(h) H.\n(1) One.\n(i) R1.\n(ii) R2.\n(iii) R3.\n(iv) R4.\n(v) R5.\n(i) Next letter."
+    assert _paths(text)[2:] == [
+        "1910.1(h)(1)(i)",
+        "1910.1(h)(1)(ii)",
+        "1910.1(h)(1)(iii)",
+        "1910.1(h)(1)(iv)",
+        "1910.1(h)(1)(v)",
+        "1910.1(i)",
+    ]
+
+
+def test_chunks_carry_their_own_section():
+    text = (
+        "1910.132(a) Application of PPE requirements.\n"
+        "(b) Hazard assessment.\n"
+        "1926.95 - Criteria for personal protective equipment.\n"
+        "(a) Application.\n"
+        "(b) Employee-owned equipment."
+    )
+    chunks = chunk_page_text(text)
+    assert [c["cfr_section"] for c in chunks] == ["1910.132", "1926.95"]
+    assert "Hazard assessment" in chunks[0]["text"]
+    assert "Employee-owned" in chunks[1]["text"]
+
+
+def test_unstructured_text_falls_back_to_character_splitter():
+    chunks = chunk_page_text("Plain guidance text with no paragraph designators. " * 5)
+    assert chunks and all(c["section_path"] is None for c in chunks)
+
+
+def test_oversized_paragraph_is_split_but_keeps_its_path():
+    text = "1910.134(a) " + "Respirators shall be provided. " * 100
+    chunks = chunk_page_text(text, chunk_size=500)
+    assert len(chunks) > 1
+    assert {c["section_path"] for c in chunks} == {"1910.134(a)"}
@@ -0,0 +1,47 @@
+"""
+Tests for URL canonicalization and SimHash near-duplicate detection.
+"""
+from src.services.dedup import NearDuplicateIndex, canonicalize_url, is_pagination_url, simhash
+
+
+def test_canonicalize_collapses_url_variants():
+    canonical = "https://www.osha.gov/laws-regs/regulations/standardnumber/1910/1910.132"
+    variants = [
+        "http://osha.gov/laws-regs/regulations/standardnumber/1910/1910.132/",
+        "https://WWW.OSHA.GOV/laws-regs/regulations/standardnumber/1910/1910.132#top",
+        "https://www.osha.gov/laws-regs//regulations/standardnumber/1910/1910.132?utm_source=x&gclid=1",
+        "https://www.osha.gov/laws-regs/regulations/standardnumber/1910/1910.132?format=print",
+    ]
+    assert {canonicalize_url(url) for url in variants} == {canonical}
+
+
+def test_canonicalize_sorts_and_keeps_meaningful_params():
+    url = "https://www.osha.gov/publications?b=2&a=1&fbclid=z"
+    assert canonicalize_url(url) == "https://www.osha.gov/publications?a=1&b=2"
+
+
+def test_pagination_urls():
+    assert is_pagination_url("https://www.osha.gov/publications?page=2")
+    assert not is_pagination_url("https://www.osha.gov/publications?page=0")
+    assert not is_pagination_url("https://www.osha.gov/publications")
+
+
+def test_simhash_is_stable_and_64_bit():
+    text = "employers shall provide fall protection at six feet"
+    assert simhash(text) == simhash(text)
+    assert 0 <= simhash(text) < 2 ** 64
+
+
+def test_near_duplicate_index_flags_near_copies_only():
+    base = " ".join(f"word{i}" for i in range(300))
+    index = NearDuplicateIndex()
+    assert not index.check_and_add(base)
+    assert index.check_and_add(base + " word300")
+    assert not index.check_and_add(" ".join(f"other{i}" for i in range(300)))
+    assert len(index.fingerprints) == 2
+
+
+def test_near_duplicate_index_restores_from_fingerprints():
+    text = " ".join(f"token{i}" for i in range(200))
+    restored = NearDuplicateIndex([simhash(text)])
+    assert restored.check_and_add(text)
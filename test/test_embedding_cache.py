@@ -0,0 +1,61 @@
+"""
+Tests for the persistent content-addressed embedding cache.
+"""
+import os
+
+import numpy as np
+
+from src.utils.embedding_cache import EmbeddingCache
+
+DIM = 4
+
+
+def _vectors(n: int, start: float = 0.0) -> np.ndarray:
+    return np.arange(start, start + n * DIM, dtype=np.float32).reshape(n, DIM)
+
+
+def test_lookup_splits_hits_and_misses(tmp_path):
+    cache = EmbeddingCache("model", directory=str(tmp_path), dim=DIM)
+    cache.add(["a", "b"], _vectors(2))
+
+    hits, matrix, misses = cache.lookup(["b", "c", "a"])
+    assert hits == [0, 2]
+    assert misses == [1]
+    np.testing.assert_array_equal(matrix, _vectors(2)[[1, 0]])
+
+
+def test_vectors_persist_and_are_keyed_by_model(tmp_path):
+    EmbeddingCache("model", directory=str(tmp_path), dim=DIM).add(["a"], _vectors(1))
+
+    hits, matrix, _ = EmbeddingCache("model", directory=str(tmp_path), dim=DIM).lookup(["a"])
+    assert hits == [0]
+    np.testing.assert_array_equal(matrix[0], _vectors(1)[0])
+    assert EmbeddingCache("other-model", directory=str(tmp_path), dim=DIM).lookup(["a"])[0] == []
+
+
+def test_torn_vector_tail_is_truncated(tmp_path):
+    cache = EmbeddingCache("model", directory=str(tmp_path), dim=DIM)
+    cache.add(["a", "b"], _vectors(2))
+    # A crash after writing half of a third vector but before its key
+    with open(cache.vectors_path, "ab") as f:
+        f.write(b"\0" * (DIM * 2))
+
+    reloaded = EmbeddingCache("model", directory=str(tmp_path), dim=DIM)
+    assert len(reloaded) == 2
+    assert os.path.getsize(reloaded.vectors_path) == 2 * DIM * 4
+
+    reloaded.add(["c"], _vectors(1, start=100.0))
+    hits, matrix, _ = reloaded.lookup(["a", "c"])
+    assert hits == [0, 1]
+    np.testing.assert_array_equal(matrix[1], _vectors(1, start=100.0)[0])
+
+
+def test_keys_without_vectors_are_dropped(tmp_path):
+    cache = EmbeddingCache("model", directory=str(tmp_path), dim=DIM)
+    cache.add(["a"], _vectors(1))
+    with open(cache.keys_path, "ab") as f:
+        f.write(cache.key("orphan"))
+
+    reloaded = EmbeddingCache("model", directory=str(tmp_path), dim=DIM)
+    assert len(reloaded) == 1
+    assert reloaded.lookup(["orphan"])[2] == [0]
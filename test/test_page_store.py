@@ -0,0 +1,55 @@
+"""
+Tests for the compressed raw page store.
+"""
+from src.db.page_store import PageStore
+
+
+def test_round_trip_and_latest_record_wins(tmp_path):
+    store = PageStore(str(tmp_path))
+    store.append("https://www.osha.gov/a", "<p>first</p>", headers={"etag": "1"})
+    store.append("https://www.osha.gov/b", "<p>b</p>")
+    store.append("https://www.osha.gov/a", "<p>second</p>", status=200)
+    store.close()
+
+    reopened = PageStore(str(tmp_path))
+    assert len(reopened) == 2
+    assert "https://www.osha.gov/a" in reopened
+    assert reopened.get("https://www.osha.gov/a")["html"] == "<p>second</p>"
+    assert reopened.get("https://www.osha.gov/missing") is None
+    assert sorted(r["url"] for r in reopened.iter_pages()) == ["https://www.osha.gov/a", "https://www.osha.gov/b"]
+
+
+def test_pdf_pages_are_stored(tmp_path):
+    store = PageStore(str(tmp_path))
+    store.append("https://www.osha.gov/x.pdf", "", pdf_pages=[[1, "page one"], [2, "page two"]], pdf_title="Fact Sheet")
+    record = store.get("https://www.osha.gov/x.pdf")
+    assert record["pdf_pages"] == [[1, "page one"], [2, "page two"]]
+    assert record["pdf_title"] == "Fact Sheet"
+    store.close()
+
+
+def test_segments_roll_over(tmp_path):
+    store = PageStore(str(tmp_path), segment_bytes=200)
+    for i in range(5):
+        store.append(f"https://www.osha.gov/{i}", f"<p>{'x' * 50} {i}</p>" + str(i) * 300)
+    store.close()
+
+    assert len(list(tmp_path.glob("segment-*.seg"))) > 1
+    reopened = PageStore(str(tmp_path))
+    assert [r["url"] for r in reopened.iter_pages()] == [f"https://www.osha.gov/{i}" for i in range(5)]
+
+
+def test_torn_index_line_is_ignored(tmp_path):
+    store = PageStore(str(tmp_path))
+    store.append("https://www.osha.gov/a", "<p>a</p>")
+    store.close()
+    with open(tmp_path / "index.jsonl", "a") as f:
+        f.write('{"url": "https://www.osha.gov/b", "segm')
+
+    reopened = PageStore(str(tmp_path))
+    assert reopened.urls() == ["https://www.osha.gov/a"]
+
+    # The first page written after the crash must survive the next reload
+    reopened.append("https://www.osha.gov/c", "<p>c</p>")
+    reopened.close()
+    assert PageStore(str(tmp_path)).urls() == ["https://www.osha.gov/a", "https://www.osha.gov/c"]